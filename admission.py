@@ -0,0 +1,69 @@
+import functools
+import threading
+
+from flask import jsonify
+
+
+class AdmissionController:
+    """Bounds how many heavy requests run at once and turns the rest away with 503 + Retry-After"""
+
+    def __init__(self, max_in_flight=4, max_wait=0.5, retry_after=5):
+        self.max_in_flight = max_in_flight
+        self.max_wait = max_wait  # seconds a request may wait for a free slot before being rejected
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Take a slot, waiting at most max_wait seconds; return False when saturated"""
+        if self.max_wait > 0:
+            acquired = self._slots.acquire(timeout=self.max_wait)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        with self._lock:
+            if acquired:
+                self.in_flight += 1
+                self.admitted += 1
+            else:
+                self.rejected += 1
+        return acquired
+
+    def release(self):
+        """Give a slot back"""
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def busy_response(self):
+        """Return the 503 response sent when no slot is free"""
+        response = jsonify({'error': 'The server is busy analyzing other documents. Please try again shortly.'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(self.retry_after)
+        return response
+
+    def stats(self):
+        """Return the current admission counters"""
+        with self._lock:
+            return {
+                'max_in_flight': self.max_in_flight,
+                'in_flight': self.in_flight,
+                'admitted': self.admitted,
+                'rejected': self.rejected
+            }
+
+    def limit(self, view):
+        """Decorate a Flask view so it only runs when a slot is free"""
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            # Runs before the request body is parsed, so a rejection costs almost nothing
+            if not self.try_acquire():
+                return self.busy_response()
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release()
+        wrapper.admission = self
+        return wrapper
@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+
+
+class DocumentCache:
+    """Bounded LRU cache of analyzed documents, keyed by their kind and the hash of their text"""
+
+    def __init__(self, max_documents=500):
+        self.max_documents = max_documents
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def get(self, document_id, kind):
+        """Return the cached document of this kind, or None if it is unknown or expired"""
+        if not document_id:
+            return None
+
+        # The same text may be cached as a resume and as a job description
+        key = (kind, document_id)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                return None
+            self._documents.move_to_end(key)
+            return document
+
+    def put(self, document_id, kind, filename, skills):
+        """Cache the extracted skills of a document and return the cached entry"""
+        document = {
+            'id': document_id,
+            'kind': kind,
+            'filename': filename,
+            'skills': skills
+        }
+
+        key = (kind, document_id)
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
+        return document
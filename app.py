@@ -1,6 +1,8 @@
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, request, jsonify, send_file, session, url_for
 from werkzeug.utils import secure_filename
 import os
+import hashlib
+import uuid
 from datetime import datetime
 from document_parser import DocumentParser
 from skill_extractor import SkillExtractor
@@ -8,11 +10,27 @@ from skill_gap_analyzer import SkillGapAnalyzer
 import json
 from report_generator import ReportGenerator
 from chatbot import SkillAnalysisChatbot
+from candidate_index import CandidateIndex
+from job_catalog import JobCatalog
+from analysis_cache import DocumentCache
+from document_pipeline import DocumentPipeline, StageTimeoutError
+from admission import AdmissionController
+from asset_pipeline import AssetPipeline, PageCache
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['SECRET_KEY'] = 'your-secret-key-here'
+app.config['STREAMING_THRESHOLD'] = 2 * 1024 * 1024  # larger uploads are extracted in chunks
+app.config['PARSE_TIMEOUT'] = 60  # seconds per document for each /upload pipeline stage
+app.config['EXTRACT_TIMEOUT'] = 60
+app.config['MAX_INFLIGHT_ANALYSES'] = 4  # concurrent parse/extract/analyze requests per process
+app.config['ADMISSION_WAIT'] = 0.5  # seconds a request may queue for a slot before getting a 503
+app.config['RETRY_AFTER'] = 5  # seconds, sent in the Retry-After header of 503 responses
+app.config['ASYNC_LIGHT_WORKERS'] = 16  # asgi.py: threads for /chat, /preview and pages
+app.config['ASYNC_MAX_QUEUED_ANALYSES'] = 8  # asgi.py: analyses waiting for a worker before 503
+app.config['ASSET_BUILD_FOLDER'] = 'build/assets'  # fingerprinted, pre-compressed static files
+app.config['TEMPLATES_AUTO_RELOAD'] = None  # set to True while editing templates or static files
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -21,94 +39,222 @@ os.makedirs('reports', exist_ok=True)
 # Initialize chatbot
 chatbot = SkillAnalysisChatbot()
 
+# Models are loaded once and shared across requests, so the analyzer's embedding cache persists
+skill_extractor = SkillExtractor()
+analyzer = SkillGapAnalyzer()
+
+# Extracted skills of recently analyzed documents, reusable by id in /upload
+document_cache = DocumentCache()
+
+# Parses and extracts the resume and job description of an upload concurrently
+document_pipeline = DocumentPipeline(
+    skill_extractor,
+    parse_timeout=app.config['PARSE_TIMEOUT'],
+    extract_timeout=app.config['EXTRACT_TIMEOUT']
+)
+
+# Backpressure: bounds in-flight analyses instead of letting requests pile up
+analysis_admission = AdmissionController(
+    max_in_flight=app.config['MAX_INFLIGHT_ANALYSES'],
+    max_wait=app.config['ADMISSION_WAIT'],
+    retry_after=app.config['RETRY_AFTER']
+)
+
+# Persistent index of every analyzed resume, used for candidate search
+candidate_index = CandidateIndex()
+
+# Catalog of open job descriptions, used to rank jobs for a single resume
+job_catalog = JobCatalog()
+
+# Static files get content-hashed URLs under /assets, so browsers can cache them for a year
+asset_pipeline = AssetPipeline(app.static_folder, app.config['ASSET_BUILD_FOLDER'])
+asset_pipeline.build()
+
+# The landing page and dashboard do not depend on the request, so they are rendered once
+page_cache = PageCache()
+
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt'}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def upload_path(filename):
+    """Return a unique temporary path for an upload, so concurrent requests never share a file"""
+    return os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}_{filename}")
+
+def parse_top_k(value, default=10):
+    """Parse a top_k request parameter; None if it is not a positive integer"""
+    try:
+        top_k = int(default if value is None or value == '' else value)
+    except (TypeError, ValueError):
+        return None
+    return top_k if top_k > 0 else None
+
+def parse_skills(value):
+    """Validate a skills request field: a list of strings or a {'technical', 'soft'} dict of them; None otherwise"""
+    def is_skill_list(skills):
+        return isinstance(skills, list) and all(isinstance(skill, str) for skill in skills)
+
+    if isinstance(value, dict):
+        if not value.keys() <= {'technical', 'soft'} or not all(is_skill_list(skills) for skills in value.values()):
+            return None
+        return value
+    return value if is_skill_list(value) else None
+
+@app.template_global()
+def asset_url(filename):
+    """Fingerprinted URL of a static file, falling back to /static for files added since startup"""
+    if app.config.get('TEMPLATES_AUTO_RELOAD'):
+        asset_pipeline.refresh()
+    return asset_pipeline.url(filename) or url_for('static', filename=filename)
+
+@app.route('/assets/<path:filename>')
+def assets(filename):
+    response = asset_pipeline.response(filename)
+    if response is None:
+        return jsonify({'error': 'Asset not found'}), 404
+    return response
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return page_cache.response('index.html')
 
-@app.route('/upload', methods=['POST'])
-def upload_files():
-    try:
-        if 'resume' not in request.files or 'job_description' not in request.files:
-            return jsonify({'error': 'Both resume and job description files are required'}), 400
+class DocumentError(Exception):
+    """Problem with an uploaded or referenced document that should be reported to the client"""
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
 
-        resume_file = request.files['resume']
-        jd_file = request.files['job_description']
+def receive_document(kind, file_field, id_field, label):
+    """Save an uploaded document for the pipeline, or resolve a previously analyzed one by id"""
+    uploaded = request.files.get(file_field)
+    document_id = request.form.get(id_field)
+    received = {'key': kind, 'kind': kind, 'label': label}
 
-        if resume_file.filename == '' or jd_file.filename == '':
-            return jsonify({'error': 'No files selected'}), 400
+    if uploaded is None or uploaded.filename == '':
+        if not document_id:
+            raise DocumentError('No files selected')
 
-        if not (allowed_file(resume_file.filename) and allowed_file(jd_file.filename)):
-            return jsonify({'error': 'Invalid file format. Supported: PDF, DOCX, TXT'}), 400
+        document = document_cache.get(document_id, kind=kind)
+        if document is None:
+            raise DocumentError(f'{label} reference not found or expired, please upload the file again', 404)
 
-        # Save files
-        resume_filename = secure_filename(resume_file.filename)
-        jd_filename = secure_filename(jd_file.filename)
+        print(f"Reusing cached {label.lower()}: {document['filename']}, hash: {document_id[:8]}")
+        received['document'] = document
+        return received
 
-        resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_filename)
-        jd_path = os.path.join(app.config['UPLOAD_FOLDER'], jd_filename)
+    if not allowed_file(uploaded.filename):
+        raise DocumentError('Invalid file format. Supported: PDF, DOCX, TXT')
 
-        resume_file.save(resume_path)
-        jd_file.save(jd_path)
+    filename = secure_filename(uploaded.filename)
+    file_path = upload_path(filename)
+    uploaded.save(file_path)
 
-        # Parse documents
-        parser = DocumentParser()
-        resume_text = parser.parse(resume_path)
-        jd_text = parser.parse(jd_path)
+    received['filename'] = filename
+    received['path'] = file_path
+    received['streaming'] = os.path.getsize(file_path) > app.config['STREAMING_THRESHOLD']
+    return received
 
-        # Validate that we have actual content
-        if not resume_text.strip():
-            return jsonify({'error': 'Resume file appears to be empty or could not be read'}), 400
+def cached_skills(received, document_id):
+    """Return the skills of an identical, previously analyzed document so extraction is skipped"""
+    document = document_cache.get(document_id, kind=received['kind'])
+    return document['skills'] if document else None
 
-        if not jd_text.strip():
-            return jsonify({'error': 'Job description file appears to be empty or could not be read'}), 400
+def finish_document(received, result):
+    """Validate a pipeline result and cache the analyzed document"""
+    if 'document' in received:
+        return received['document']
 
-        # Debug logging
-        import hashlib
-        resume_hash = hashlib.md5(resume_text.encode()).hexdigest()[:8]
-        jd_hash = hashlib.md5(jd_text.encode()).hexdigest()[:8]
+    label = received['label']
 
-        print(f"Resume file: {resume_filename}, size: {len(resume_text)} chars, hash: {resume_hash}")
-        print(f"Resume text preview: {resume_text[:200]}...")
-        print(f"JD file: {jd_filename}, size: {len(jd_text)} chars, hash: {jd_hash}")
-        print(f"JD text preview: {jd_text[:200]}...")
+    # Validate that we have actual content
+    if result['skills'] is None:
+        raise DocumentError(f'{label} file appears to be empty or could not be read')
 
-        # Extract skills
-        skill_extractor = SkillExtractor()
-        resume_skills = skill_extractor.extract_skills(resume_text)
-        jd_skills = skill_extractor.extract_skills(jd_text)
+    text = result['text']
+    if text is None:
+        print(f"{label} file: {received['filename']}, streamed, hash: {result['document_id'][:8]}")
+    else:
+        print(f"{label} file: {received['filename']}, size: {len(text)} chars, hash: {result['document_id'][:8]}")
+        print(f"{label} text preview: {text[:200]}...")
+
+    return document_cache.put(result['document_id'], received['kind'], received['filename'], result['skills'])
+
+@app.route('/upload', methods=['POST'])
+@analysis_admission.limit
+def upload_files():
+    try:
+        has_resume = 'resume' in request.files or request.form.get('resume_id')
+        has_jd = 'job_description' in request.files or request.form.get('jd_id')
+        if not (has_resume and has_jd):
+            return jsonify({'error': 'Both resume and job description files are required'}), 400
+
+        # Parse documents and extract skills concurrently (or reuse a previously analyzed document)
+        received = []
+        try:
+            received.append(receive_document('resume', 'resume', 'resume_id', 'Resume'))
+            received.append(receive_document('jd', 'job_description', 'jd_id', 'Job description'))
+
+            uploads = [document for document in received if 'path' in document]
+            results = document_pipeline.run(uploads, lookup=cached_skills)
+        finally:
+            # Clean up uploaded files
+            for document in received:
+                if 'path' in document and os.path.exists(document['path']):
+                    os.remove(document['path'])
+
+        resume, jd = (finish_document(document, results.get(document['key'])) for document in received)
+
+        resume_skills = resume['skills']
+        jd_skills = jd['skills']
 
         print(f"Resume skills: {resume_skills}")
         print(f"JD skills: {jd_skills}")
 
-        # Analyze skill gap
-        analyzer = SkillGapAnalyzer()
-        analysis_result = analyzer.analyze(resume_skills, jd_skills)
+        # Analyze skill gap, incrementally when iterating on one side of the previous analysis
+        previous = session.get('analysis_data')
+        if previous and (previous.get('resume_id') == resume['id'] or previous.get('jd_id') == jd['id']):
+            analysis_result, best_matches = analyzer.analyze_incremental(previous, resume_skills, jd_skills)
+        else:
+            analysis_result, best_matches = analyzer.analyze_with_matches(resume_skills, jd_skills)
 
         print(f"Analysis result: {analysis_result}")
 
+        # Keep the resume's skills searchable after the upload itself is deleted; an edited
+        # version of this session's resume (same filename) replaces its candidate entry
+        candidate_id = None
+        if previous and previous.get('candidate_id') in range(len(candidate_index)):
+            if candidate_index.get(previous['candidate_id'])['name'] == resume['filename']:
+                candidate_id = previous['candidate_id']
+        candidate_id = candidate_index.add(
+            resume['filename'], resume_skills, fingerprint=resume['id'], candidate_id=candidate_id
+        )
+
         # Store analysis data in session for chatbot access
         session['analysis_data'] = {
+            'candidate_id': candidate_id,
+            'resume_id': resume['id'],
+            'jd_id': jd['id'],
             'resume_skills': resume_skills,
             'jd_skills': jd_skills,
-            'analysis': analysis_result
+            'analysis': analysis_result,
+            'best_matches': best_matches
         }
 
-        # Clean up uploaded files
-        os.remove(resume_path)
-        os.remove(jd_path)
-
         return jsonify({
             'success': True,
+            'candidate_id': candidate_id,
+            'resume_id': resume['id'],
+            'jd_id': jd['id'],
             'resume_skills': resume_skills,
             'jd_skills': jd_skills,
             'analysis': analysis_result
         })
 
+    except DocumentError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except StageTimeoutError as e:
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -128,7 +274,7 @@ def preview_file():
 
         # Save file temporarily
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        file_path = upload_path(filename)
         file.save(file_path)
 
         try:
@@ -212,9 +358,165 @@ def chat():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/search_candidates', methods=['POST'])
+@analysis_admission.limit
+def search_candidates():
+    try:
+        # Query either by an uploaded job description or by an explicit skill list
+        if 'job_description' in request.files:
+            jd_file = request.files['job_description']
+
+            if jd_file.filename == '':
+                return jsonify({'error': 'No file selected'}), 400
+
+            if not allowed_file(jd_file.filename):
+                return jsonify({'error': 'Invalid file format. Supported: PDF, DOCX, TXT'}), 400
+
+            jd_path = upload_path(secure_filename(jd_file.filename))
+            jd_file.save(jd_path)
+
+            try:
+                jd_text = DocumentParser().parse(jd_path)
+            finally:
+                os.remove(jd_path)
+
+            if not jd_text.strip():
+                return jsonify({'error': 'Job description file appears to be empty or could not be read'}), 400
+
+            jd_skills = skill_extractor.extract_skills(jd_text)
+            options = request.form
+        else:
+            options = request.get_json(silent=True)
+            if not isinstance(options, dict):
+                options = {}
+            if not options.get('skills'):
+                return jsonify({'error': 'Provide a job description file or a list of skills'}), 400
+
+            jd_skills = parse_skills(options['skills'])
+            if jd_skills is None:
+                return jsonify({'error': "skills must be a list of strings or a {'technical', 'soft'} object of them"}), 400
+
+        top_k = parse_top_k(options.get('top_k'))
+        if top_k is None:
+            return jsonify({'error': 'top_k must be a positive integer'}), 400
+
+        require_all = str(options.get('require_all', 'false')).lower() in ('1', 'true', 'yes')
+
+        results = candidate_index.search(jd_skills, top_k=top_k, require_all=require_all)
+
+        return jsonify({
+            'success': True,
+            'jd_skills': jd_skills,
+            'total_candidates': len(candidate_index),
+            'candidates': results
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/add_job', methods=['POST'])
+@analysis_admission.limit
+def add_job():
+    try:
+        if 'job_description' not in request.files:
+            return jsonify({'error': 'Job description file is required'}), 400
+
+        jd_file = request.files['job_description']
+
+        if jd_file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+
+        if not allowed_file(jd_file.filename):
+            return jsonify({'error': 'Invalid file format. Supported: PDF, DOCX, TXT'}), 400
+
+        jd_filename = secure_filename(jd_file.filename)
+        jd_path = upload_path(jd_filename)
+        jd_file.save(jd_path)
+
+        try:
+            jd_text = DocumentParser().parse(jd_path)
+        finally:
+            os.remove(jd_path)
+
+        if not jd_text.strip():
+            return jsonify({'error': 'Job description file appears to be empty or could not be read'}), 400
+
+        jd_skills = skill_extractor.extract_skills(jd_text)
+        job_id = job_catalog.add(
+            request.form.get('title') or jd_filename,
+            jd_skills,
+            fingerprint=hashlib.md5(jd_text.encode()).hexdigest()
+        )
+
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'jd_skills': jd_skills,
+            'total_jobs': len(job_catalog)
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/match_jobs', methods=['POST'])
+@analysis_admission.limit
+def match_jobs():
+    try:
+        if 'resume' not in request.files:
+            return jsonify({'error': 'Resume file is required'}), 400
+
+        resume_file = request.files['resume']
+
+        if resume_file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+
+        if not allowed_file(resume_file.filename):
+            return jsonify({'error': 'Invalid file format. Supported: PDF, DOCX, TXT'}), 400
+
+        top_k = parse_top_k(request.form.get('top_k'))
+        if top_k is None:
+            return jsonify({'error': 'top_k must be a positive integer'}), 400
+
+        resume_path = upload_path(secure_filename(resume_file.filename))
+        resume_file.save(resume_path)
+
+        try:
+            resume_text = DocumentParser().parse(resume_path)
+        finally:
+            os.remove(resume_path)
+
+        if not resume_text.strip():
+            return jsonify({'error': 'Resume file appears to be empty or could not be read'}), 400
+
+        resume_skills = skill_extractor.extract_skills(resume_text)
+
+        # Rank the whole catalog first, then run the full gap analysis only for the returned jobs
+        ranked = job_catalog.rank(resume_skills, top_k=top_k)
+
+        jobs = []
+        if ranked:
+            for job_id, score in ranked:
+                job = job_catalog.get(job_id)
+                jobs.append({
+                    'job_id': job_id,
+                    'title': job['title'],
+                    'score': score,
+                    'analysis': analyzer.analyze(resume_skills, job['skills'])
+                })
+
+        return jsonify({
+            'success': True,
+            'resume_skills': resume_skills,
+            'total_jobs': len(job_catalog),
+            'jobs': jobs
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/dashboard')
 def dashboard():
-    return render_template('dashboard.html')
+    return page_cache.response('dashboard.html')
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
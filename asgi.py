@@ -0,0 +1,197 @@
+"""Async (ASGI) serving mode for the SkillGap AI app.
+
+Run with:
+    uvicorn asgi:application --port 5000
+or:
+    python asgi.py
+
+Request bodies are read and responses written on the event loop without blocking it.
+The Flask views themselves run in two bounded thread pools: one for the heavy routes
+(parsing, model inference, report generation) and one for everything else, so cheap
+/chat, /preview and page requests never queue behind running analyses.
+"""
+import asyncio
+import io
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app
+
+# Routes whose work is parsing, skill extraction, gap analysis or report generation
+HEAVY_PATHS = {'/upload', '/match_jobs', '/add_job', '/search_candidates', '/export_report'}
+
+
+class ClientDisconnected(Exception):
+    """The client went away before sending its whole request body"""
+
+
+class AsyncServer:
+    """ASGI application that runs a WSGI app's views in bounded executors"""
+
+    def __init__(self, wsgi_app, heavy_workers=4, light_workers=16, max_queued=8,
+                 max_body_size=None, retry_after=5):
+        self.wsgi_app = wsgi_app
+        self.heavy_workers = heavy_workers
+        self.max_queued = max_queued  # heavy requests allowed to wait for a worker before 503
+        self.max_body_size = max_body_size
+        self.retry_after = retry_after
+        self.heavy_executor = ThreadPoolExecutor(max_workers=heavy_workers, thread_name_prefix='analysis')
+        self.light_executor = ThreadPoolExecutor(max_workers=light_workers, thread_name_prefix='request')
+        self.heavy_pending = 0  # only touched on the event loop thread
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.heavy_executor.shutdown(wait=False, cancel_futures=True)
+                self.light_executor.shutdown(wait=False, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        heavy = scope['path'] in HEAVY_PATHS
+
+        if heavy:
+            # Shed load before reading the body when every analysis worker and queue slot is
+            # taken; the slot is held from here on, so uploads still arriving count against it
+            if self.heavy_pending >= self.heavy_workers + self.max_queued:
+                await self._send_json(send, 503, {
+                    'error': 'The server is busy analyzing other documents. Please try again shortly.'
+                }, [(b'retry-after', str(self.retry_after).encode())])
+                return
+            self.heavy_pending += 1
+
+        try:
+            try:
+                body = await self._read_body(receive)
+            except ClientDisconnected:
+                return
+            if body is None:
+                await self._send_json(send, 413, {'error': 'File too large'})
+                return
+
+            environ = self._environ(scope, body)
+            executor = self.heavy_executor if heavy else self.light_executor
+            loop = asyncio.get_running_loop()
+            status, headers, chunks = await loop.run_in_executor(executor, self._run_wsgi, environ)
+        finally:
+            if heavy:
+                self.heavy_pending -= 1
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        for chunk in chunks:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def _read_body(self, receive):
+        """Collect the request body from the client; None if it exceeds max_body_size"""
+        parts = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                # A truncated body must not reach the view
+                raise ClientDisconnected()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if self.max_body_size and size > self.max_body_size:
+                return None
+            parts.append(chunk)
+            if not message.get('more_body', False):
+                break
+        return b''.join(parts)
+
+    @staticmethod
+    async def _send_json(send, status, payload, extra_headers=()):
+        body = json.dumps(payload).encode()
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers + list(extra_headers)})
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    def _environ(scope, body):
+        """Translate an ASGI HTTP scope into a WSGI environ"""
+        server_name, server_port = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf8').decode('latin1'),
+            'PATH_INFO': scope['path'].encode('utf8').decode('latin1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin1'),
+            'SERVER_NAME': server_name,
+            'SERVER_PORT': str(server_port),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+            # The body is already fully buffered, so it is terminated even for chunked requests
+            'wsgi.input_terminated': True,
+        }
+
+        for raw_name, raw_value in scope.get('headers', []):
+            name = raw_name.decode('latin1').upper().replace('-', '_')
+            value = raw_value.decode('latin1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+            elif name == 'CONTENT_LENGTH':
+                environ['CONTENT_LENGTH'] = value
+            else:
+                key = 'HTTP_' + name
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+        # Chunked requests carry no Content-Length header; the buffered length is the real one
+        environ['CONTENT_LENGTH'] = str(len(body))
+        return environ
+
+    def _run_wsgi(self, environ):
+        """Call the WSGI app (in an executor thread) and return status, headers and body chunks"""
+        response = {}
+        chunks = []
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [
+                (name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers
+            ]
+            return chunks.append
+
+        result = self.wsgi_app(environ, start_response)
+        try:
+            for chunk in result:
+                if chunk:
+                    chunks.append(chunk)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        return response['status'], response['headers'], chunks
+
+
+application = AsyncServer(
+    app,
+    heavy_workers=app.config['MAX_INFLIGHT_ANALYSES'],
+    light_workers=app.config['ASYNC_LIGHT_WORKERS'],
+    max_queued=app.config['ASYNC_MAX_QUEUED_ANALYSES'],
+    max_body_size=app.config['MAX_CONTENT_LENGTH'],
+    retry_after=app.config['RETRY_AFTER']
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(application, host='127.0.0.1', port=5000)
@@ -0,0 +1,221 @@
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+
+from flask import Response, current_app, render_template, request, send_file
+
+# Text formats worth compressing; images and fonts are already compressed
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.html', '.svg', '.json', '.txt', '.map'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+VARIANT_SUFFIXES = {'br': 'br', 'gzip': 'gz'}
+
+
+def available_encodings():
+    """Content encodings that can be generated here, in order of preference"""
+    return ('br', 'gzip') if BROTLI_AVAILABLE else ('gzip',)
+
+
+def compress(encoding, content):
+    if encoding == 'br':
+        return brotli.compress(content, quality=11)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def negotiate_encoding(encodings):
+    """Pick the preferred encoding among the given ones that the client accepts, or None for identity"""
+    for encoding in encodings:
+        if request.accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+class AssetPipeline:
+    """Fingerprints static files and pre-generates their compressed variants for long-lived caching"""
+
+    def __init__(self, static_folder, build_folder='build/assets', url_prefix='/assets', min_size=1024):
+        self.static_folder = static_folder
+        self.build_folder = build_folder
+        self.url_prefix = url_prefix
+        self.min_size = min_size  # smaller files are not worth a compressed variant
+        self.assets = {}  # static path -> asset entry
+        self.fingerprinted = {}  # fingerprinted path -> static path
+        self._lock = threading.Lock()
+
+    def build(self):
+        """Fingerprint every static file, write missing compressed variants and the manifest"""
+        for root, _, files in os.walk(self.static_folder):
+            for name in sorted(files):
+                static_path = os.path.relpath(os.path.join(root, name), self.static_folder)
+                self._build_asset(static_path.replace(os.sep, '/'))
+        self._write_manifest()
+        return self.assets
+
+    def _build_asset(self, static_path):
+        source = os.path.join(self.static_folder, static_path)
+        stat = os.stat(source)
+        with open(source, 'rb') as f:
+            content = f.read()
+
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        base, extension = os.path.splitext(static_path)
+        fingerprinted = f"{base}.{digest}{extension}"
+
+        # Variant files are named after the content hash, so existing ones are always current
+        variants = {}
+        if extension.lower() in COMPRESSIBLE_EXTENSIONS and len(content) >= self.min_size:
+            for encoding in available_encodings():
+                path = os.path.join(self.build_folder, f"{fingerprinted}.{VARIANT_SUFFIXES[encoding]}")
+                if not os.path.exists(path):
+                    compressed = compress(encoding, content)
+                    if len(compressed) >= len(content):
+                        continue
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    temporary_path = f"{path}.{os.getpid()}.tmp"
+                    with open(temporary_path, 'wb') as f:
+                        f.write(compressed)
+                    os.replace(temporary_path, path)
+                variants[encoding] = path
+
+        asset = {
+            'path': fingerprinted,
+            'source': source,
+            'digest': digest,
+            'size': len(content),
+            'mtime': stat.st_mtime,
+            'mimetype': mimetypes.guess_type(static_path)[0] or 'application/octet-stream',
+            'variants': variants
+        }
+        with self._lock:
+            previous = self.assets.get(static_path)
+            if previous is not None:
+                self.fingerprinted.pop(previous['path'], None)
+            self.assets[static_path] = asset
+            self.fingerprinted[fingerprinted] = static_path
+        return asset
+
+    def _write_manifest(self):
+        os.makedirs(self.build_folder, exist_ok=True)
+        manifest = {
+            static_path: {
+                'path': asset['path'],
+                'size': asset['size'],
+                'variants': {
+                    encoding: os.path.getsize(path) for encoding, path in asset['variants'].items()
+                }
+            }
+            for static_path, asset in sorted(self.assets.items())
+        }
+        with open(os.path.join(self.build_folder, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def refresh(self):
+        """Re-fingerprint static files that changed since they were built (used while TEMPLATES_AUTO_RELOAD is set)"""
+        for static_path, asset in list(self.assets.items()):
+            try:
+                if os.stat(asset['source']).st_mtime != asset['mtime']:
+                    self._build_asset(static_path)
+            except FileNotFoundError:
+                continue
+
+    def url(self, static_path):
+        """Return the fingerprinted URL of a static file, or None if it is not a known asset"""
+        asset = self.assets.get(static_path)
+        if asset is None:
+            return None
+        return f"{self.url_prefix}/{asset['path']}"
+
+    def response(self, fingerprinted):
+        """Serve a fingerprinted asset in the best encoding the client accepts; None if unknown"""
+        static_path = self.fingerprinted.get(fingerprinted)
+        if static_path is None:
+            return None
+
+        asset = self.assets[static_path]
+        encoding = negotiate_encoding([e for e in available_encodings() if e in asset['variants']])
+        etag = f"{asset['digest']}-{encoding}" if encoding else asset['digest']
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            path = asset['variants'][encoding] if encoding else asset['source']
+            response = send_file(os.path.abspath(path), mimetype=asset['mimetype'], conditional=False, etag=False)
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        if asset['variants']:
+            response.vary.add('Accept-Encoding')
+        return response
+
+
+class PageCache:
+    """Rendered output of request-independent templates, kept with compressed variants and an ETag"""
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def _render(self, template_name):
+        body = render_template(template_name).encode('utf-8')
+        page = {
+            'body': body,
+            'etag': hashlib.sha256(body).hexdigest()[:16],
+            'variants': {encoding: compress(encoding, body) for encoding in available_encodings()}
+        }
+        return page
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+    def response(self, template_name):
+        """Return the rendered template, answering 304 when the client's copy is current"""
+        # Pages are only re-rendered per request while templates are being edited; `python app.py`
+        # runs with debug=True, so debug mode alone does not turn the cache off
+        reload = current_app.config.get('TEMPLATES_AUTO_RELOAD')
+        page = None if reload else self._pages.get(template_name)
+        if page is None:
+            page = self._render(template_name)
+            if not reload:
+                with self._lock:
+                    self._pages[template_name] = page
+        encoding = negotiate_encoding(available_encodings())
+        etag = f"{page['etag']}-{encoding}" if encoding else page['etag']
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(page['variants'][encoding] if encoding else page['body'],
+                                mimetype='text/html')
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+
+        # The page URL is not fingerprinted, so browsers revalidate it on every visit
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fingerprint and pre-compress the static assets.')
+    parser.add_argument('--static', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
+    parser.add_argument('--output', default='build/assets')
+    args = parser.parse_args()
+
+    pipeline = AssetPipeline(args.static, args.output)
+    for static_path, asset in sorted(pipeline.build().items()):
+        sizes = ', '.join(f"{encoding} {os.path.getsize(path)}" for encoding, path in asset['variants'].items())
+        print(f"{static_path} -> {asset['path']} ({asset['size']} bytes{'; ' + sizes if sizes else ''})")
@@ -0,0 +1,349 @@
+"""Offline batch scoring of resumes against job descriptions.
+
+Examples:
+    python batch_runner.py --resumes archive/resumes --jds archive/jds --output results.jsonl
+    python batch_runner.py --manifest pairs.csv --output results.jsonl --workers 8
+
+Every (resume, job description) pair is parsed, extracted and analyzed in a process
+pool and written to the output as one JSON line. Progress is checkpointed next to the
+output, so re-running the same command after an interruption continues where it stopped.
+
+With --scores-only, each document is extracted once in the pool (and kept in a skills file
+next to the output, so a restart does not extract it again) and match percentages come
+from one resumes x JDs matrix product per block of pairs, without the per-pair gap analysis.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+# Per-worker state, created once by _init_worker so models are loaded once per process
+_parser = None
+_extractor = None
+_analyzer = None
+
+
+def _init_worker():
+    """Load the parser and models once in each worker process"""
+    global _parser, _extractor, _analyzer
+    from document_parser import DocumentParser
+    from skill_extractor import SkillExtractor
+    from skill_gap_analyzer import SkillGapAnalyzer
+
+    _parser = DocumentParser()
+    _extractor = SkillExtractor()
+    _analyzer = SkillGapAnalyzer()
+
+
+@lru_cache(maxsize=256)
+def _document_skills(path):
+    """Parse a document and extract its skills, cached so a JD shared by many pairs is read once"""
+    text = _parser.parse(path)
+    if not text.strip():
+        raise ValueError(f"{path} appears to be empty or could not be read")
+    return _extractor.extract_skills(text)
+
+
+def _run_task(task):
+    """Analyze one (resume, job description) pair and return its output record"""
+    resume_path, jd_path = task
+    record = {'resume': resume_path, 'jd': jd_path}
+    try:
+        resume_skills = _document_skills(resume_path)
+        jd_skills = _document_skills(jd_path)
+        analysis = _analyzer.analyze(resume_skills, jd_skills)
+        record['match_percentage'] = analysis['match_percentage']
+        record['resume_skills'] = resume_skills
+        record['jd_skills'] = jd_skills
+        record['analysis'] = analysis
+    except Exception as e:
+        record['error'] = str(e)
+    return record
+
+
+def _extract_task(path):
+    """Extract one document's skills, returning (path, skills, error)"""
+    try:
+        return path, _document_skills(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def _score_blocks(pool, pairs, chunksize, skill_cache, retry_failed=False, block_size=10000, sync_every=100):
+    """Yield lists of output records with match percentages only, one matrix product per block of pairs"""
+    paths = sorted(set(path for pair in pairs for path in pair))
+    skills, errors = skill_cache.extract(pool, paths, chunksize, retry_failed=retry_failed, sync_every=sync_every)
+
+    # Blocks are whole resumes with the JDs they are paired with, about block_size pairs each,
+    # so each block's resumes x JDs matrix stays bounded however large the archive is
+    jds_by_resume = {}
+    for resume_path, jd_path in pairs:
+        jds_by_resume.setdefault(resume_path, []).append(jd_path)
+
+    block = []
+    block_pairs = 0
+    for resume_path, jd_paths in jds_by_resume.items():
+        block.append((resume_path, jd_paths))
+        block_pairs += len(jd_paths)
+        if block_pairs >= block_size:
+            yield _score_block(block, skills, errors)
+            block = []
+            block_pairs = 0
+    if block:
+        yield _score_block(block, skills, errors)
+
+
+def _score_block(block, skills, errors):
+    """Score (resume, [jd, ...]) entries with one match_matrix call and return their records"""
+    from skill_gap_analyzer import SkillGapAnalyzer
+
+    resumes = [resume for resume, _ in block if resume in skills]
+    jds = sorted(set(jd for _, jd_paths in block for jd in jd_paths if jd in skills))
+    scores = SkillGapAnalyzer.match_matrix([skills[path] for path in resumes], [skills[path] for path in jds])
+    resume_rows = {path: row for row, path in enumerate(resumes)}
+    jd_columns = {path: column for column, path in enumerate(jds)}
+
+    records = []
+    for resume_path, jd_paths in block:
+        for jd_path in jd_paths:
+            record = {'resume': resume_path, 'jd': jd_path}
+            error = errors.get(resume_path) or errors.get(jd_path)
+            if error:
+                record['error'] = error
+            else:
+                record['match_percentage'] = round(float(scores[resume_rows[resume_path], jd_columns[jd_path]]), 2)
+                record['resume_skills'] = skills[resume_path]
+                record['jd_skills'] = skills[jd_path]
+            records.append(record)
+    return records
+
+
+def find_documents(directory):
+    """Return every supported document below a directory, in a stable order"""
+    documents = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in SUPPORTED_EXTENSIONS:
+                documents.append(os.path.join(root, filename))
+    return sorted(documents)
+
+
+def read_manifest(manifest_path):
+    """Read (resume, jd) pairs from a CSV or JSONL manifest; relative paths are resolved against it"""
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    with open(manifest_path, 'r', encoding='utf-8', newline='') as manifest_file:
+        if manifest_path.lower().endswith('.jsonl'):
+            rows = [json.loads(line) for line in manifest_file if line.strip()]
+        else:
+            rows = list(csv.DictReader(manifest_file))
+
+    return [
+        (os.path.join(base_dir, row['resume']), os.path.join(base_dir, row['jd']))
+        for row in rows
+    ]
+
+
+def complete_prefix(path):
+    """Return the length of a JSONL file up to its last complete, valid line"""
+    offset = 0
+    with open(path, 'rb') as jsonl_file:
+        for line in jsonl_file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                json.loads(line)
+            except ValueError:
+                break
+            offset += len(line)
+    return offset
+
+
+class Checkpoint:
+    """Tracks how much of the output file holds complete, durable results"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.path = output_path + '.checkpoint'
+
+    def restore(self, retry_failed=False):
+        """Cut the output back to the last checkpoint and return the keys of pairs already done"""
+        if not os.path.exists(self.output_path):
+            return set()
+
+        # Results written after the last checkpoint, or after the last intact line, are redone
+        offset = complete_prefix(self.output_path)
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as checkpoint_file:
+                offset = min(offset, json.load(checkpoint_file)['output_offset'])
+
+        with open(self.output_path, 'r+b') as output_file:
+            output_file.truncate(offset)
+
+        completed = set()
+        with open(self.output_path, 'r', encoding='utf-8') as output_file:
+            for line in output_file:
+                record = json.loads(line)
+                if retry_failed and 'error' in record:
+                    continue
+                completed.add((record['resume'], record['jd']))
+        return completed
+
+    def save(self, output_file, completed, failed):
+        """Make everything written so far durable and record the output offset atomically"""
+        output_file.flush()
+        os.fsync(output_file.fileno())
+
+        state = {
+            'output_offset': output_file.tell(),
+            'completed': completed,
+            'failed': failed,
+            'updated': datetime.now().isoformat(timespec='seconds')
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(state, checkpoint_file)
+        os.replace(temp_path, self.path)
+
+
+class SkillCache:
+    """Skills extracted by --scores-only runs, kept in a JSONL file next to the output
+
+    Every document is appended as soon as it is extracted, so an interrupted run does not
+    extract it again when restarted.
+    """
+
+    def __init__(self, output_path):
+        self.path = output_path + '.skills.jsonl'
+
+    def load(self, retry_failed=False):
+        """Return (skills, errors) by path, dropping a partially written last line"""
+        skills = {}
+        errors = {}
+        if not os.path.exists(self.path):
+            return skills, errors
+
+        with open(self.path, 'r+b') as cache_file:
+            cache_file.truncate(complete_prefix(self.path))
+
+        with open(self.path, 'r', encoding='utf-8') as cache_file:
+            for line in cache_file:
+                entry = json.loads(line)
+                # A later line for the same document (a retry) replaces the earlier one
+                skills.pop(entry['path'], None)
+                errors.pop(entry['path'], None)
+                if entry.get('error') is None:
+                    skills[entry['path']] = entry['skills']
+                elif not retry_failed:
+                    errors[entry['path']] = entry['error']
+        return skills, errors
+
+    def extract(self, pool, paths, chunksize, retry_failed=False, sync_every=100):
+        """Return (skills, errors) of every path, extracting in the pool the ones not cached yet"""
+        skills, errors = self.load(retry_failed=retry_failed)
+        missing = [path for path in paths if path not in skills and path not in errors]
+        print(f"{len(paths)} documents, {len(paths) - len(missing)} already extracted, {len(missing)} to extract")
+
+        with open(self.path, 'a', encoding='utf-8') as cache_file:
+            results = pool.imap_unordered(_extract_task, missing, chunksize=chunksize)
+            for count, (path, document_skills, error) in enumerate(results, 1):
+                if error is None:
+                    skills[path] = document_skills
+                else:
+                    errors[path] = error
+                cache_file.write(json.dumps({'path': path, 'skills': document_skills, 'error': error}) + '\n')
+
+                if count % sync_every == 0 or count == len(missing):
+                    cache_file.flush()
+                    os.fsync(cache_file.fileno())
+                    print(f"{count}/{len(missing)} documents extracted")
+
+        return skills, errors
+
+
+def run(tasks, output_path, workers=None, chunksize=8, checkpoint_every=100, retry_failed=False,
+        scores_only=False, block_size=10000):
+    """Score every pair not already in the output, appending results as they complete"""
+    checkpoint = Checkpoint(output_path)
+    done = checkpoint.restore(retry_failed=retry_failed)
+    pending = [task for task in dict.fromkeys(tasks) if task not in done]
+
+    print(f"{len(tasks)} pairs, {len(tasks) - len(pending)} already done, {len(pending)} to run")
+    if not pending:
+        return
+
+    completed = 0
+    failed = 0
+    started = time.time()
+
+    with open(output_path, 'a', encoding='utf-8') as output_file, \
+            multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        if scores_only:
+            blocks = _score_blocks(pool, pending, chunksize, SkillCache(output_path), retry_failed=retry_failed,
+                                   block_size=block_size, sync_every=checkpoint_every)
+        else:
+            blocks = ([record] for record in pool.imap_unordered(_run_task, pending, chunksize=chunksize))
+
+        for block in blocks:
+            for record in block:
+                output_file.write(json.dumps(record) + '\n')
+                completed += 1
+                if 'error' in record:
+                    failed += 1
+
+                if completed % checkpoint_every == 0:
+                    checkpoint.save(output_file, completed, failed)
+                    rate = completed / (time.time() - started)
+                    print(f"{completed}/{len(pending)} pairs ({failed} failed), {rate:.1f} pairs/s")
+
+            if scores_only:
+                # A block is scored at once, so it is made durable at once
+                checkpoint.save(output_file, completed, failed)
+
+        checkpoint.save(output_file, completed, failed)
+
+    print(f"Finished {completed} pairs ({failed} failed) in {time.time() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score resumes against job descriptions in bulk.')
+    parser.add_argument('--resumes', help='directory of resumes (scored against every JD in --jds)')
+    parser.add_argument('--jds', help='directory of job descriptions')
+    parser.add_argument('--manifest', help='CSV (resume,jd columns) or JSONL file listing the pairs to score')
+    parser.add_argument('--output', required=True, help='JSONL file results are appended to')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=8, help='pairs handed to a worker at a time')
+    parser.add_argument('--checkpoint-every', type=int, default=100, help='results between checkpoints')
+    parser.add_argument('--retry-failed', action='store_true', help='re-run pairs that failed previously (new results are appended)')
+    parser.add_argument('--scores-only', action='store_true', help='only compute match percentages, as matrix products')
+    parser.add_argument('--block-size', type=int, default=10000, help='pairs scored per matrix product with --scores-only')
+    args = parser.parse_args()
+
+    if args.manifest:
+        tasks = read_manifest(args.manifest)
+    elif args.resumes and args.jds:
+        jds = find_documents(args.jds)
+        tasks = [(resume, jd) for resume in find_documents(args.resumes) for jd in jds]
+    else:
+        parser.error('either --manifest or both --resumes and --jds are required')
+
+    run(
+        tasks,
+        args.output,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        checkpoint_every=args.checkpoint_every,
+        retry_failed=args.retry_failed,
+        scores_only=args.scores_only,
+        block_size=args.block_size
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""Time SkillGapAnalyzer.analyze and measure SkillGapAnalyzer.match_matrix on synthetic skill sets.
+
+Usage:
+    python benchmarks/analyzer_benchmark.py [--repeat 20000] [--resumes 5000] [--jds 200]
+
+The analyzer runs without the sentence-transformer model, so only exact matching is
+timed. analyze is compared with the set-based implementation it had before skills were
+interned to ids. match_matrix is compared with scoring the same pairs one analyze call
+at a time; its peak memory (tracemalloc) is reported for resumes whose skills are mostly
+distinct, like spaCy noun-chunk skills in a large archive.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+    from skill_extractor import SkillExtractor  # noqa: E402
+    from skill_gap_analyzer import SkillGapAnalyzer  # noqa: E402
+
+
+def reference_analyze(resume_skills, jd_skills):
+    """The previous SkillGapAnalyzer.analyze, without the model (exact matching only)"""
+    resume_tech = set(skill.lower() for skill in resume_skills.get('technical', []))
+    resume_soft = set(skill.lower() for skill in resume_skills.get('soft', []))
+    jd_tech = set(skill.lower() for skill in jd_skills.get('technical', []))
+    jd_soft = set(skill.lower() for skill in jd_skills.get('soft', []))
+
+    matched_tech = resume_tech.intersection(jd_tech)
+    matched_soft = resume_soft.intersection(jd_soft)
+    missing_tech = jd_tech - resume_tech
+    missing_soft = jd_soft - resume_soft
+    extra_tech = resume_tech - jd_tech
+    extra_soft = resume_soft - jd_soft
+
+    total_jd_skills = len(jd_tech) + len(jd_soft)
+    total_matched = len(matched_tech) + len(matched_soft)
+    match_percentage = (total_matched / total_jd_skills * 100) if total_jd_skills > 0 else 0
+
+    return {
+        'match_percentage': round(match_percentage, 2),
+        'matched': {
+            'technical': [skill.title() for skill in matched_tech],
+            'soft': [skill.title() for skill in matched_soft]
+        },
+        'partially_matched': {'technical': [], 'soft': []},
+        'missing': {
+            'technical': [skill.title() for skill in missing_tech],
+            'soft': [skill.title() for skill in missing_soft]
+        },
+        'extra': {
+            'technical': [skill.title() for skill in extra_tech],
+            'soft': [skill.title() for skill in extra_soft]
+        },
+        'summary': {
+            'total_resume_skills': len(resume_tech) + len(resume_soft),
+            'total_jd_skills': total_jd_skills,
+            'matched_count': total_matched,
+            'missing_count': len(missing_tech) + len(missing_soft)
+        }
+    }
+
+
+class SkillSets:
+    """Reproducible {'technical', 'soft'} skill dicts drawn from the extractor's skill lists"""
+
+    def __init__(self, seed=42):
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            extractor = SkillExtractor()
+        self.technical = sorted(extractor.technical_skills | extractor.programming_languages)
+        self.soft = sorted(extractor.soft_skills)
+        self.rng = random.Random(seed)
+        self.chunk_count = 0
+
+    def make(self, technical_count, soft_count, distinct_count=0):
+        """A skill dict; distinct_count technical skills are new noun-chunk style names"""
+        technical = [skill.title() for skill in self.rng.sample(self.technical, technical_count)]
+        for _ in range(distinct_count):
+            self.chunk_count += 1
+            technical.append(f"Reporting Platform {self.chunk_count}")
+        soft = [skill.title() for skill in self.rng.sample(self.soft, soft_count)]
+        return {'technical': technical, 'soft': soft}
+
+
+def time_per_call(function, pairs, repeat):
+    """Average microseconds per call over repeat calls cycling through pairs"""
+    started = time.perf_counter()
+    for index in range(repeat):
+        resume_skills, jd_skills = pairs[index % len(pairs)]
+        function(resume_skills, jd_skills)
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark skill gap analysis and batch scoring.')
+    parser.add_argument('--repeat', type=int, default=20000, help='analyze calls per timing')
+    parser.add_argument('--resumes', type=int, default=5000, help='resumes scored by match_matrix')
+    parser.add_argument('--jds', type=int, default=200, help='job descriptions scored by match_matrix')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    skill_sets = SkillSets(args.seed)
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        analyzer = SkillGapAnalyzer()
+    analyzer.model = None
+
+    pairs = [(skill_sets.make(15, 4, distinct_count=3), skill_sets.make(10, 3)) for _ in range(200)]
+    for resume_skills, jd_skills in pairs:
+        assert analyzer.analyze(resume_skills, jd_skills)['match_percentage'] == \
+            reference_analyze(resume_skills, jd_skills)['match_percentage']
+
+    reference_us = time_per_call(reference_analyze, pairs, args.repeat)
+    analyze_us = time_per_call(analyzer.analyze, pairs, args.repeat)
+    print(f"analyze, one pair:    {analyze_us:8.1f} us per call "
+          f"(previous set-based version {reference_us:.1f} us, {analyze_us / reference_us:.2f}x)")
+
+    resumes = [skill_sets.make(5, 2, distinct_count=15) for _ in range(args.resumes)]
+    jds = [skill_sets.make(10, 3, distinct_count=2) for _ in range(args.jds)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    scores = SkillGapAnalyzer.match_matrix(resumes, jds)
+    matrix_seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Per-pair scoring is timed on a sample of resumes and scaled to the full matrix
+    sample = resumes[:max(1, min(len(resumes), 200))]
+    started = time.perf_counter()
+    for row, resume_skills in enumerate(sample):
+        for column, jd_skills in enumerate(jds):
+            assert abs(analyzer.analyze(resume_skills, jd_skills)['match_percentage'] - scores[row, column]) < 0.01
+    per_pair_seconds = (time.perf_counter() - started) * len(resumes) / len(sample)
+
+    print(f"match_matrix, {args.resumes} x {args.jds}: {matrix_seconds:8.3f} s, "
+          f"peak {peak / 1024 / 1024:.1f} MB (output {scores.nbytes / 1024 / 1024:.1f} MB); "
+          f"one analyze per pair: {per_pair_seconds:.3f} s (estimated)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Bytes and request time of the landing page: plain /static serving vs the asset pipeline.
+
+Usage:
+    python benchmarks/asset_benchmark.py --repeat 200
+
+Uses the Flask test client, so no server is started. A "first visit" fetches the page and
+every asset it references; a "repeat visit" replays what a browser sends on the second
+visit. With plain /static the page is re-rendered and each asset is revalidated with
+If-None-Match; with the pipeline the page is revalidated once and the fingerprinted
+assets are served from the browser cache without a request (Cache-Control: immutable).
+"""
+import argparse
+import gzip
+import os
+import re
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+ASSET_PATTERN = re.compile(r'(?:href|src)="(/(?:static|assets)/[^"]+)"')
+BROWSER_HEADERS = {'Accept-Encoding': 'gzip, deflate, br'}
+
+
+def plain_page(app_module):
+    """Render index.html the way the app did before the pipeline: fresh, with /static URLs"""
+    from flask import render_template
+
+    app_module.app.jinja_env.globals['asset_url'] = lambda filename: f'/static/{filename}'
+    try:
+        with app_module.app.test_request_context('/'):
+            return render_template('index.html').encode('utf-8')
+    finally:
+        app_module.app.jinja_env.globals['asset_url'] = app_module.asset_url
+
+
+def decode(response):
+    """Return the body of a response, undoing its Content-Encoding"""
+    encoding = response.headers.get('Content-Encoding')
+    if encoding == 'br':
+        import brotli
+        return brotli.decompress(response.get_data())
+    if encoding == 'gzip':
+        return gzip.decompress(response.get_data())
+    return response.get_data()
+
+
+def fetch(client, url, headers):
+    response = client.get(url, headers=headers)
+    body = response.get_data()
+    response.close()
+    return response, len(body)
+
+
+def visit_plain(app_module, client, etags=None):
+    """Fetch the plain page and its /static assets; return (bytes, requests, asset ETags)"""
+    html = plain_page(app_module)
+    total, requests_sent, seen = len(html), 1, {}
+    for url in ASSET_PATTERN.findall(html.decode()):
+        headers = dict(BROWSER_HEADERS)
+        if etags and url in etags:
+            headers['If-None-Match'] = etags[url]
+        response, size = fetch(client, url, headers)
+        total += size
+        requests_sent += 1
+        seen[url] = response.headers.get('ETag')
+    return total, requests_sent, seen
+
+
+def visit_pipeline(client, page_etag=None):
+    """Fetch the cached page and, on a first visit, its fingerprinted assets"""
+    headers = dict(BROWSER_HEADERS)
+    if page_etag:
+        headers['If-None-Match'] = page_etag
+    response, total = fetch(client, '/', headers)
+    requests_sent = 1
+    if page_etag is None:
+        html = decode(response)
+        for url in ASSET_PATTERN.findall(html.decode()):
+            _, size = fetch(client, url, BROWSER_HEADERS)
+            total += size
+            requests_sent += 1
+    return total, requests_sent, response.headers.get('ETag')
+
+
+def time_per_call(function, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare landing page bytes and request time.')
+    parser.add_argument('--repeat', type=int, default=200, help='requests per timing')
+    args = parser.parse_args()
+
+    # The pipeline writes build/assets relative to the working directory
+    os.chdir(tempfile.mkdtemp(prefix='skillgap_assets_'))
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        import app as app_module
+    client = app_module.app.test_client()
+
+    plain_first, plain_first_requests, etags = visit_plain(app_module, client)
+    plain_repeat, plain_repeat_requests, _ = visit_plain(app_module, client, etags)
+    pipeline_first, pipeline_first_requests, page_etag = visit_pipeline(client)
+    pipeline_repeat, pipeline_repeat_requests, _ = visit_pipeline(client, page_etag)
+
+    print(f"{'':<10} {'first visit':>22} {'repeat visit':>22}")
+    print(f"{'plain':<10} {plain_first:>12} B {plain_first_requests:>3} req "
+          f"{plain_repeat:>12} B {plain_repeat_requests:>3} req")
+    print(f"{'pipeline':<10} {pipeline_first:>12} B {pipeline_first_requests:>3} req "
+          f"{pipeline_repeat:>12} B {pipeline_repeat_requests:>3} req")
+
+    def uncached():
+        app_module.page_cache.clear()
+        fetch(client, '/', BROWSER_HEADERS)
+
+    uncached_ms = time_per_call(uncached, args.repeat)
+    cached_ms = time_per_call(lambda: fetch(client, '/', BROWSER_HEADERS), args.repeat)
+    revalidate_ms = time_per_call(
+        lambda: fetch(client, '/', dict(BROWSER_HEADERS, **{'If-None-Match': page_etag})), args.repeat)
+    print(f"GET / rendered and compressed: {uncached_ms:.3f} ms, cached: {cached_ms:.3f} ms, "
+          f"304: {revalidate_ms:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
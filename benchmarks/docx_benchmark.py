@@ -0,0 +1,84 @@
+"""Compare the streaming DocxReader with python-docx on speed and peak memory.
+
+Usage:
+    python benchmarks/docx_benchmark.py [--repeat 50] [file.docx ...]
+
+Without arguments the repo's sample documents are used.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from docx_reader import DocxReader  # noqa: E402
+
+try:
+    from docx import Document
+    PYTHON_DOCX_AVAILABLE = True
+except ImportError:
+    PYTHON_DOCX_AVAILABLE = False
+
+DEFAULT_FILES = [
+    os.path.join(ROOT, 'Data_Analyst_Resume_Swetha.docx'),
+    os.path.join(ROOT, 'sample jd.docx'),
+]
+
+
+def python_docx_text(file_path):
+    """The previous DocumentParser._parse_docx implementation"""
+    doc = Document(file_path)
+    return "\n".join([paragraph.text for paragraph in doc.paragraphs]).strip()
+
+
+def streaming_text(file_path):
+    return DocxReader().read(file_path).strip()
+
+
+def measure(extract, file_path, repeat):
+    """Return (mean seconds per call, peak traced bytes of one call, extracted text)"""
+    text = extract(file_path)  # warm-up (imports, caches)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        extract(file_path)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    extract(file_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DOCX text extraction.')
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    engines = [('streaming', streaming_text)]
+    if PYTHON_DOCX_AVAILABLE:
+        engines.insert(0, ('python-docx', python_docx_text))
+    else:
+        print("python-docx not installed; only the streaming reader is measured")
+
+    print(f"{'file':<36} {'engine':<12} {'ms/call':>9} {'peak KiB':>9} {'chars':>7}")
+    for file_path in args.files:
+        results = {}
+        for name, extract in engines:
+            elapsed, peak, text = measure(extract, file_path, args.repeat)
+            results[name] = (elapsed, peak)
+            print(f"{os.path.basename(file_path):<36} {name:<12} {elapsed * 1000:>9.2f} {peak / 1024:>9.1f} {len(text):>7}")
+
+        if len(results) == 2:
+            (old_time, old_peak), (new_time, new_peak) = results['python-docx'], results['streaming']
+            print(f"{'':<36} {'speedup':<12} {old_time / new_time:>8.1f}x {old_peak / new_peak:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
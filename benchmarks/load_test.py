@@ -0,0 +1,285 @@
+"""Local load test for /upload and /chat with stub models.
+
+Usage:
+    python benchmarks/load_test.py --concurrency 1 2 4 8 16 --requests 20
+    python benchmarks/load_test.py --max-inflight 0      # admission control disabled
+
+The app is served in-process by a threaded Werkzeug server, with the spaCy and
+SentenceTransformer models replaced by the deterministic stubs in stubs.py so the run is
+offline and reproducible. Uploads are synthetic TXT resumes/JDs (a fresh resume per request,
+so the document cache never short-circuits the work). Every concurrency level reports
+throughput and p50/p95/p99 latency per endpoint, plus how many uploads were turned away
+with 503 by admission control.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, redirect_stdout
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from admission import AdmissionController  # noqa: E402
+from stubs import StubEncoder, StubNLP, SyntheticDocuments  # noqa: E402
+
+CHAT_MESSAGES = [
+    "What is my match percentage?",
+    "Which skills am I missing?",
+    "What do you recommend I learn first?",
+    "Compare my resume with the job",
+]
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def send(request, timeout):
+    """Send a request and return its HTTP status, including error statuses"""
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code
+
+
+def multipart_request(url, files):
+    """Build a multipart/form-data POST of {field: (filename, bytes)}"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for field, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f'Content-Type: text/plain\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return urllib.request.Request(
+        url,
+        data=b''.join(parts),
+        headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+        method='POST'
+    )
+
+
+def json_request(url, payload):
+    return urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+
+
+class Workload:
+    """Issues the mixed /upload + /chat traffic of one client"""
+
+    def __init__(self, base_url, documents, chat_ratio, jd_pool, timeout):
+        self.base_url = base_url
+        self.documents = documents
+        self.chat_ratio = chat_ratio
+        self.jd_pool = jd_pool
+        self.timeout = timeout
+        self.sequence = itertools.count()
+        self.chat_context = None
+
+    def upload(self):
+        index = next(self.sequence)
+        request = multipart_request(self.base_url + '/upload', {
+            'resume': (f'resume_{index}.txt', self.documents.resume(index).encode()),
+            'job_description': (f'jd_{index % self.jd_pool}.txt',
+                                self.documents.job_description(index % self.jd_pool).encode())
+        })
+        return send(request, self.timeout)
+
+    def chat(self, rng):
+        request = json_request(self.base_url + '/chat', {
+            'message': rng.choice(CHAT_MESSAGES),
+            'analysis_data': self.chat_context
+        })
+        return send(request, self.timeout)
+
+    def run_client(self, client_id, request_count, results, lock):
+        rng = random.Random(client_id)
+        for _ in range(request_count):
+            endpoint = 'chat' if rng.random() < self.chat_ratio else 'upload'
+            started = time.perf_counter()
+            try:
+                status = self.chat(rng) if endpoint == 'chat' else self.upload()
+            except Exception:
+                status = 'error'
+            latency = time.perf_counter() - started
+            with lock:
+                results.append((endpoint, status, latency))
+
+
+def summarize(results, elapsed):
+    """Aggregate (endpoint, status, latency) samples per endpoint"""
+    summary = {}
+    for endpoint in sorted(set(endpoint for endpoint, _, _ in results)):
+        samples = [(status, latency) for name, status, latency in results if name == endpoint]
+        ok = [latency for status, latency in samples if status == 200]
+        rejected = [latency for status, latency in samples if status == 503]
+        summary[endpoint] = {
+            'requests': len(samples),
+            'ok': len(ok),
+            'rejected': len(rejected),
+            'errors': len(samples) - len(ok) - len(rejected),
+            'throughput': len(ok) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(ok, 50) * 1000,
+            'p95_ms': percentile(ok, 95) * 1000,
+            'p99_ms': percentile(ok, 99) * 1000,
+            'rejected_p50_ms': percentile(rejected, 50) * 1000
+        }
+    return summary
+
+
+def chat_context(app_module, documents):
+    """Run one analysis in-process to use as the /chat analysis_data"""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        resume_skills = app_module.skill_extractor.extract_skills(documents.resume(0))
+        jd_skills = app_module.skill_extractor.extract_skills(documents.job_description(0))
+        return {
+            'resume_skills': resume_skills,
+            'jd_skills': jd_skills,
+            'analysis': app_module.analyzer.analyze(resume_skills, jd_skills)
+        }
+
+
+def load_app(args, work_dir):
+    """Import the app with stub models and isolated storage"""
+    # The app creates data/, uploads/ and reports/ relative to the working directory,
+    # so the run's candidate index and job catalog stay out of the repo
+    os.chdir(work_dir)
+
+    # The app builds its SkillExtractor and SkillGapAnalyzer on import, so the model loaders
+    # are patched first; the real spaCy and SentenceTransformer models are never loaded
+    import spacy
+    import skill_gap_analyzer
+
+    nlp = StubNLP(cost_ms_per_kb=args.nlp_ms_per_kb, busy=args.busy)
+    encoder = StubEncoder(cost_ms=args.encode_ms, busy=args.busy)
+    with ExitStack() as patches, open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        patches.enter_context(mock.patch.object(spacy, 'load', lambda *load_args, **load_kwargs: nlp))
+        patches.enter_context(mock.patch.object(
+            skill_gap_analyzer, 'SentenceTransformer', lambda *model_args, **model_kwargs: encoder, create=True))
+        patches.enter_context(mock.patch.object(skill_gap_analyzer, 'SENTENCE_TRANSFORMERS_AVAILABLE', True))
+        import app as app_module
+
+    use_admission(app_module, AdmissionController(
+        max_in_flight=args.max_inflight if args.max_inflight > 0 else 1000000,
+        max_wait=args.admission_wait,
+        retry_after=app_module.app.config['RETRY_AFTER']
+    ))
+    return app_module
+
+
+def use_admission(app_module, admission):
+    """Guard the app's admission-limited views with another controller"""
+    for endpoint, view in list(app_module.app.view_functions.items()):
+        if getattr(view, 'admission', None) is app_module.analysis_admission:
+            app_module.app.view_functions[endpoint] = admission.limit(view.__wrapped__)
+    app_module.analysis_admission = admission
+
+
+def serve_threaded(wsgi_app):
+    """Serve a WSGI app with the threaded Werkzeug server on a free port"""
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietRequestHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', 0, wsgi_app, threaded=True, request_handler=QuietRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_server(args, work_dir):
+    """Import the app with stub models and isolated storage, and serve it on a free port"""
+    app_module = load_app(args, work_dir)
+    return serve_threaded(app_module.app), app_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test /upload and /chat with stub models.')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--requests', type=int, default=20, help='requests per client per level')
+    parser.add_argument('--chat-ratio', type=float, default=0.3, help='share of requests going to /chat')
+    parser.add_argument('--jd-pool', type=int, default=5, help='distinct job descriptions in rotation')
+    parser.add_argument('--nlp-ms-per-kb', type=float, default=5.0, help='stub spaCy cost per KB of text')
+    parser.add_argument('--encode-ms', type=float, default=20.0, help='stub encoder cost per encode call')
+    parser.add_argument('--busy', action='store_true', help='stub costs spin the CPU instead of sleeping')
+    parser.add_argument('--max-inflight', type=int, default=4, help='admission limit; 0 disables it')
+    parser.add_argument('--admission-wait', type=float, default=0.5)
+    parser.add_argument('--timeout', type=float, default=120.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='also write the results to this file')
+    parser.add_argument('--verbose', action='store_true', help="keep the app's debug output")
+    args = parser.parse_args()
+
+    output_path = os.path.abspath(args.json) if args.json else None
+    work_dir = tempfile.mkdtemp(prefix='skillgap_load_')
+    server, app_module = start_server(args, work_dir)
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    documents = SyntheticDocuments(app_module.skill_extractor, seed=args.seed)
+    workload = Workload(base_url, documents, args.chat_ratio, args.jd_pool, args.timeout)
+
+    # One analysis gives /chat realistic context and warms up imports and caches
+    workload.chat_context = chat_context(app_module, documents)
+
+    report = []
+    print(f"{'clients':>7} {'endpoint':<8} {'reqs':>5} {'ok':>5} {'503':>5} {'err':>4} "
+          f"{'ok/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'503 p50':>8}")
+
+    try:
+        for concurrency in args.concurrency:
+            results = []
+            lock = threading.Lock()
+            started = time.perf_counter()
+            with open(os.devnull, 'w') as devnull, \
+                    redirect_stdout(sys.stdout if args.verbose else devnull), \
+                    ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for client_id in range(concurrency):
+                    pool.submit(workload.run_client, client_id, args.requests, results, lock)
+            elapsed = time.perf_counter() - started
+
+            summary = summarize(results, elapsed)
+            report.append({'concurrency': concurrency, 'elapsed': elapsed, 'endpoints': summary})
+            for endpoint, stats in summary.items():
+                print(f"{concurrency:>7} {endpoint:<8} {stats['requests']:>5} {stats['ok']:>5} "
+                      f"{stats['rejected']:>5} {stats['errors']:>4} {stats['throughput']:>7.1f} "
+                      f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} "
+                      f"{stats['rejected_p50_ms']:>8.1f}")
+    finally:
+        server.shutdown()
+
+    print(f"Admission: {app_module.analysis_admission.stats()}")
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            json.dump({'arguments': vars(args), 'levels': report}, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
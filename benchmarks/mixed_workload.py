@@ -0,0 +1,161 @@
+"""Compare /chat latency under background /upload load for the sync and async serving modes.
+
+Usage:
+    python benchmarks/mixed_workload.py --upload-clients 16 --chat-clients 4 --duration 10
+    python benchmarks/mixed_workload.py --mode asgi --busy
+
+A fixed number of clients keep /upload saturated for the whole run while other clients
+send /chat requests back to back; the report is the /chat latency (p50/p95/p99) plus the
+upload throughput and 503 count. "sync" serves app.app with the threaded Werkzeug server
+(one thread per connection, as `python app.py` does); "asgi" serves asgi.application with
+uvicorn, where analyses run in the bounded heavy executor and /chat in the light one.
+Both use the stub models and synthetic documents from stubs.py.
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import Workload, chat_context, load_app, serve_threaded, summarize  # noqa: E402
+from stubs import SyntheticDocuments  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class UvicornThread:
+    """Runs a uvicorn server for an ASGI app on a background thread"""
+
+    def __init__(self, asgi_app):
+        import uvicorn
+
+        self.port = free_port()
+        config = uvicorn.Config(asgi_app, host='127.0.0.1', port=self.port, log_level='warning',
+                                access_log=False, lifespan='on')
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+
+    def shutdown(self):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def start(mode, app_module):
+    """Return (server, base_url) for the requested serving mode"""
+    if mode == 'sync':
+        server = serve_threaded(app_module.app)
+        return server, f'http://127.0.0.1:{server.server_port}'
+
+    import asgi
+
+    server = UvicornThread(asgi.application)
+    return server, f'http://127.0.0.1:{server.port}'
+
+
+def run_mode(mode, args, app_module, documents, context):
+    server, base_url = start(mode, app_module)
+    workload = Workload(base_url, documents, 0.0, args.jd_pool, args.timeout)
+    workload.chat_context = context
+
+    results = []
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def upload_client():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                status = workload.upload()
+            except Exception:
+                status = 'error'
+            with lock:
+                results.append(('upload', status, time.perf_counter() - started))
+
+    def chat_client(client_id):
+        rng = random.Random(client_id)
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                status = workload.chat(rng)
+            except Exception:
+                status = 'error'
+            with lock:
+                results.append(('chat', status, time.perf_counter() - started))
+            time.sleep(args.chat_interval)
+
+    threads = [threading.Thread(target=upload_client) for _ in range(args.upload_clients)]
+    threads += [threading.Thread(target=chat_client, args=(client_id,)) for client_id in range(args.chat_clients)]
+
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(sys.stdout if args.verbose else devnull):
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            time.sleep(args.duration)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    return summarize(results, elapsed), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare /chat latency under /upload load, sync vs ASGI.')
+    parser.add_argument('--mode', choices=['sync', 'asgi', 'both'], default='both')
+    parser.add_argument('--upload-clients', type=int, default=16, help='clients keeping /upload busy')
+    parser.add_argument('--chat-clients', type=int, default=4)
+    parser.add_argument('--chat-interval', type=float, default=0.05, help='pause between chat requests')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per mode')
+    parser.add_argument('--jd-pool', type=int, default=5, help='distinct job descriptions in rotation')
+    parser.add_argument('--nlp-ms-per-kb', type=float, default=5.0, help='stub spaCy cost per KB of text')
+    parser.add_argument('--encode-ms', type=float, default=20.0, help='stub encoder cost per encode call')
+    parser.add_argument('--busy', action='store_true', help='stub costs spin the CPU instead of sleeping')
+    parser.add_argument('--max-inflight', type=int, default=4, help='admission limit; 0 disables it')
+    parser.add_argument('--admission-wait', type=float, default=0.5)
+    parser.add_argument('--timeout', type=float, default=120.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='also write the results to this file')
+    parser.add_argument('--verbose', action='store_true', help="keep the app's debug output")
+    args = parser.parse_args()
+
+    output_path = os.path.abspath(args.json) if args.json else None
+    app_module = load_app(args, tempfile.mkdtemp(prefix='skillgap_mixed_'))
+    documents = SyntheticDocuments(app_module.skill_extractor, seed=args.seed)
+    context = chat_context(app_module, documents)
+
+    report = []
+    print(f"{'mode':<5} {'endpoint':<8} {'reqs':>5} {'ok':>5} {'503':>5} {'err':>4} "
+          f"{'ok/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    for mode in (['sync', 'asgi'] if args.mode == 'both' else [args.mode]):
+        summary, elapsed = run_mode(mode, args, app_module, documents, context)
+        report.append({'mode': mode, 'elapsed': elapsed, 'endpoints': summary})
+        for endpoint, stats in summary.items():
+            print(f"{mode:<5} {endpoint:<8} {stats['requests']:>5} {stats['ok']:>5} "
+                  f"{stats['rejected']:>5} {stats['errors']:>4} {stats['throughput']:>7.1f} "
+                  f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f}")
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            json.dump({'arguments': vars(args), 'modes': report}, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Deterministic stand-ins for the spaCy and SentenceTransformer models, plus synthetic documents.
+
+They let the benchmarks run offline and reproducibly: embeddings are derived from a hash
+of the text, and an optional per-call cost simulates model inference time.
+"""
+import hashlib
+import random
+import time
+
+import numpy as np
+
+
+def simulate_work(milliseconds, busy):
+    """Spend the given time either sleeping (I/O-like, releases the GIL) or spinning (CPU-bound)"""
+    if milliseconds <= 0:
+        return
+    if not busy:
+        time.sleep(milliseconds / 1000)
+        return
+    deadline = time.perf_counter() + milliseconds / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+class StubEncoder:
+    """SentenceTransformer replacement returning hash-seeded unit vectors"""
+
+    def __init__(self, dimensions=384, cost_ms=0.0, busy=False):
+        self.dimensions = dimensions
+        self.cost_ms = cost_ms
+        self.busy = busy
+
+    def encode(self, sentences):
+        simulate_work(self.cost_ms, self.busy)
+        vectors = np.empty((len(sentences), self.dimensions), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            seed = int.from_bytes(hashlib.md5(sentence.encode()).digest()[:4], 'little')
+            vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+            vectors[row] = vector / np.linalg.norm(vector)
+        return vectors
+
+
+class StubDoc:
+    noun_chunks = ()
+
+
+class StubNLP:
+    """spaCy pipeline replacement that finds no noun chunks but costs time in proportion to the text"""
+
+    max_length = 1000000
+
+    def __init__(self, cost_ms_per_kb=0.0, busy=False):
+        self.cost_ms_per_kb = cost_ms_per_kb
+        self.busy = busy
+
+    def __call__(self, text):
+        simulate_work(self.cost_ms_per_kb * len(text) / 1024, self.busy)
+        return StubDoc()
+
+
+FILLER_SENTENCES = [
+    "Worked closely with stakeholders to deliver projects on schedule.",
+    "Responsible for maintaining documentation and internal reports.",
+    "Participated in code reviews and design discussions.",
+    "Improved existing processes and reduced turnaround times.",
+    "The team is distributed across several time zones.",
+    "Candidates should be comfortable working in a fast-paced environment.",
+]
+
+
+class SyntheticDocuments:
+    """Generates reproducible resume and job description texts from the extractor's skill lists"""
+
+    def __init__(self, skill_extractor, seed=42):
+        self.technical = sorted(skill_extractor.technical_skills | skill_extractor.programming_languages)
+        self.soft = sorted(skill_extractor.soft_skills)
+        self.seed = seed
+
+    def _text(self, kind, index, skill_count, filler_lines):
+        rng = random.Random(f"{self.seed}-{kind}-{index}")
+        technical = rng.sample(self.technical, min(skill_count, len(self.technical)))
+        soft = rng.sample(self.soft, min(max(1, skill_count // 3), len(self.soft)))
+
+        heading = 'PROFESSIONAL EXPERIENCE' if kind == 'resume' else 'REQUIREMENTS'
+        lines = [f"{kind.upper()} #{index}", heading]
+        lines += [f"Experience with {skill}." for skill in technical]
+        lines += [f"Strong {skill} skills." for skill in soft]
+        lines += [rng.choice(FILLER_SENTENCES) for _ in range(filler_lines)]
+        rng.shuffle(lines)
+        return '\n'.join(lines)
+
+    def resume(self, index, skill_count=15, filler_lines=40):
+        return self._text('resume', index, skill_count, filler_lines)
+
+    def job_description(self, index, skill_count=10, filler_lines=20):
+        return self._text('jd', index, skill_count, filler_lines)
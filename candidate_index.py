@@ -0,0 +1,208 @@
+import bisect
+import json
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from skill_vocabulary import SkillVocabulary
+
+
+class CandidateIndex:
+    """Persistent inverted index from skill to the candidates (resumes) that have it"""
+
+    def __init__(self, index_path=os.path.join('data', 'candidates.jsonl')):
+        self.index_path = index_path
+        self.candidates = []  # candidate id -> stored record
+        self.vocabulary = SkillVocabulary()
+        self.postings = {}  # skill id -> list of candidate ids (ascending)
+        self._posting_arrays = {}  # skill id -> cached numpy posting list
+        self._fingerprints = {}  # resume text hash -> candidate id
+        self._lock = threading.Lock()
+
+        index_dir = os.path.dirname(self.index_path)
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+        self._load()
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def _load(self):
+        """Rebuild the in-memory index from the append-only candidate log"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as index_file:
+            for line in index_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line (e.g. after a crash) is skipped
+                    continue
+                self._index_record(record)
+
+        print(f"Candidate index loaded: {len(self.candidates)} candidates, {len(self.postings)} skills")
+
+    def _index_record(self, record):
+        """Assign the next candidate id to a record and add it to the posting lists"""
+        replaces = record.get('replaces')
+        if replaces is not None and 0 <= replaces < len(self.candidates):
+            return self._replace_record(replaces, record)
+
+        candidate_id = len(self.candidates)
+        record['id'] = candidate_id
+        self.candidates.append(record)
+
+        if record.get('fingerprint'):
+            self._fingerprints[record['fingerprint']] = candidate_id
+
+        for skill_id in self.vocabulary.intern_all(self._skill_terms(record['skills'])).tolist():
+            self.postings.setdefault(skill_id, []).append(candidate_id)
+            self._posting_arrays.pop(skill_id, None)
+
+        return candidate_id
+
+    def _replace_record(self, candidate_id, record):
+        """Swap a candidate's record for a newer one, moving the candidate between posting lists"""
+        previous = self.candidates[candidate_id]
+        if self._fingerprints.get(previous.get('fingerprint')) == candidate_id:
+            del self._fingerprints[previous['fingerprint']]
+
+        for skill_id in self.vocabulary.intern_all(self._skill_terms(previous['skills'])).tolist():
+            self.postings[skill_id].remove(candidate_id)
+            self._posting_arrays.pop(skill_id, None)
+
+        record['id'] = candidate_id
+        self.candidates[candidate_id] = record
+
+        if record.get('fingerprint'):
+            self._fingerprints[record['fingerprint']] = candidate_id
+
+        for skill_id in self.vocabulary.intern_all(self._skill_terms(record['skills'])).tolist():
+            # Posting lists stay sorted by candidate id, which find() relies on
+            bisect.insort(self.postings.setdefault(skill_id, []), candidate_id)
+            self._posting_arrays.pop(skill_id, None)
+
+        return candidate_id
+
+    @staticmethod
+    def _skill_terms(skills):
+        """Normalize a {'technical': [...], 'soft': [...]} dict (or a plain list) into lowercase terms"""
+        if isinstance(skills, dict):
+            skills = list(skills.get('technical', [])) + list(skills.get('soft', []))
+        return sorted(set(skill.lower().strip() for skill in skills if skill and skill.strip()))
+
+    def _posting_array(self, skill):
+        """Return the posting list of a skill as a numpy array, built on first use"""
+        skill_id = self.vocabulary.get_id(skill)
+        if skill_id is None:
+            return np.zeros(0, dtype=np.int32)
+
+        ids = self._posting_arrays.get(skill_id)
+        if ids is None:
+            ids = np.asarray(self.postings.get(skill_id, []), dtype=np.int32)
+            self._posting_arrays[skill_id] = ids
+        return ids
+
+    def add(self, name, skills, fingerprint=None, candidate_id=None):
+        """Add an analyzed resume to the index and return its candidate id
+
+        Passing the id of an existing candidate replaces that candidate's record instead, so an
+        edited resume that is uploaded again does not show up as another candidate.
+        """
+        with self._lock:
+            if fingerprint and fingerprint in self._fingerprints:
+                return self._fingerprints[fingerprint]
+
+            record = {
+                'name': name,
+                'fingerprint': fingerprint,
+                'skills': {
+                    'technical': list(skills.get('technical', [])),
+                    'soft': list(skills.get('soft', []))
+                },
+                'added': datetime.now().isoformat(timespec='seconds')
+            }
+            if candidate_id is not None and 0 <= candidate_id < len(self.candidates):
+                # The log stays append-only; replaying it applies the replacement again
+                record['replaces'] = candidate_id
+            candidate_id = self._index_record(record)
+
+            with open(self.index_path, 'a', encoding='utf-8') as index_file:
+                stored = {key: value for key, value in record.items() if key != 'id'}
+                index_file.write(json.dumps(stored) + '\n')
+
+            return candidate_id
+
+    def get(self, candidate_id):
+        """Return the stored record of a candidate"""
+        return self.candidates[candidate_id]
+
+    def find(self, skills):
+        """Return ids of the candidates that have every one of the given skills"""
+        terms = self._skill_terms(skills)
+        if not terms:
+            return []
+
+        with self._lock:
+            # Intersect the shortest posting lists first so the working set shrinks quickly
+            posting_lists = sorted((self._posting_array(term) for term in terms), key=len)
+            result = posting_lists[0]
+            for ids in posting_lists[1:]:
+                if result.size == 0:
+                    break
+                result = np.intersect1d(result, ids, assume_unique=True)
+
+        return result.tolist()
+
+    def search(self, jd_skills, top_k=10, require_all=False):
+        """Score every indexed candidate against a job description's skills and return the best matches"""
+        jd_terms = self._skill_terms(jd_skills)
+        if not jd_terms or not self.candidates:
+            return []
+
+        if require_all:
+            # Only candidates with every skill qualify, so they all score 100%
+            eligible = np.asarray(self.find(jd_terms), dtype=np.int64)
+            percentages = np.full(eligible.size, 100.0)
+        else:
+            with self._lock:
+                matched_counts = np.zeros(len(self.candidates), dtype=np.int32)
+                for term in jd_terms:
+                    ids = self._posting_array(term)
+                    if ids.size:
+                        # Candidate ids are unique within a posting list, so fancy-index add is safe
+                        matched_counts[ids] += 1
+            eligible = np.flatnonzero(matched_counts)
+            percentages = matched_counts[eligible] * (100.0 / len(jd_terms))
+
+        if eligible.size == 0:
+            return []
+
+        top_k = min(top_k, eligible.size)
+        if top_k < eligible.size:
+            best = np.argpartition(-percentages, top_k - 1)[:top_k]
+        else:
+            best = np.arange(eligible.size)
+        best = best[np.argsort(-percentages[best], kind='stable')]
+
+        jd_term_set = set(jd_terms)
+        results = []
+        for position in best:
+            candidate = self.candidates[int(eligible[position])]
+            candidate_terms = set(self._skill_terms(candidate['skills']))
+            results.append({
+                'candidate_id': candidate['id'],
+                'name': candidate['name'],
+                'match_percentage': round(float(percentages[position]), 2),
+                'matched': sorted(skill.title() for skill in jd_term_set & candidate_terms),
+                'missing': sorted(skill.title() for skill in jd_term_set - candidate_terms),
+                'added': candidate.get('added')
+            })
+
+        return results
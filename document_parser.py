@@ -1,11 +1,12 @@
 import PyPDF2
 import pdfplumber
-from docx import Document
 import os
+from docx_reader import DocxReader
 
 class DocumentParser:
     def __init__(self):
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        self.docx_reader = DocxReader()
     
     def parse(self, file_path):
         """Parse document and extract text content"""
@@ -20,6 +21,67 @@ class DocumentParser:
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
+    def iter_text(self, file_path):
+        """Yield the document's text piece by piece (pages, paragraphs or blocks) without holding all of it"""
+        file_ext = os.path.splitext(file_path)[1].lower()
+
+        if file_ext == '.pdf':
+            return self._iter_pdf(file_path)
+        elif file_ext == '.docx':
+            return self._iter_docx(file_path)
+        elif file_ext == '.txt':
+            return self._iter_txt(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+
+    def _iter_pdf(self, file_path):
+        """Yield the text of a PDF one page at a time"""
+        yielded = False
+        try:
+            with pdfplumber.open(file_path) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    # Release the page's parsed layout objects before moving on
+                    page.flush_cache()
+                    if page_text:
+                        yielded = True
+                        yield page_text + "\n"
+        except Exception as e:
+            # Pages already handed out cannot be taken back, so only fall back before the first one
+            if yielded:
+                raise Exception(f"Error parsing PDF: {str(e)}")
+        else:
+            return
+
+        # Fallback to PyPDF2, as in _parse_pdf
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                for page in pdf_reader.pages:
+                    yield page.extract_text() + "\n"
+        except Exception as e:
+            raise Exception(f"Error parsing PDF: {str(e)}")
+
+    def _iter_docx(self, file_path):
+        """Yield the text of a DOCX one paragraph or table row at a time"""
+        try:
+            for line in self.docx_reader.iter_lines(file_path):
+                yield line + "\n"
+        except Exception as e:
+            raise Exception(f"Error parsing DOCX: {str(e)}")
+
+    def _iter_txt(self, file_path, block_size=64 * 1024):
+        """Yield the text of a TXT file in fixed-size blocks"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                while True:
+                    block = file.read(block_size)
+                    if not block:
+                        break
+                    yield block
+        except Exception as e:
+            raise Exception(f"Error parsing TXT: {str(e)}")
+
     def _parse_pdf(self, file_path):
         """Extract text from PDF file"""
         text = ""
@@ -43,11 +105,9 @@ class DocumentParser:
         return text.strip()
     
     def _parse_docx(self, file_path):
-        """Extract text from DOCX file"""
+        """Extract text from DOCX file, including tables, headers, footers and text boxes"""
         try:
-            doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text.strip()
+            return self.docx_reader.read(file_path).strip()
         except Exception as e:
             raise Exception(f"Error parsing DOCX: {str(e)}")
     
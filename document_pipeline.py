@@ -0,0 +1,224 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from document_parser import DocumentParser
+
+
+# Extractor used by stream_document in worker processes, loaded once per worker by _init_worker
+_worker_extractor = None
+
+# Modules imported once by the forkserver, so new workers start with them already loaded.
+# Workers would otherwise each re-import the main module (e.g. app.py with its models).
+WORKER_PRELOAD = ['__main__', 'document_parser', 'skill_extractor']
+
+
+def _init_worker():
+    """Load the skill extractor once in each PDF worker process"""
+    global _worker_extractor
+    from skill_extractor import SkillExtractor
+
+    _worker_extractor = SkillExtractor()
+
+
+def parse_document(file_path):
+    """Parse a document to text (module-level so it can run in a worker process)"""
+    return DocumentParser().parse(file_path)
+
+
+def stream_document(file_path, skill_extractor=None):
+    """Parse and extract a large document chunk by chunk, hashing it on the way"""
+    if skill_extractor is None:
+        skill_extractor = _worker_extractor
+
+    digest = hashlib.md5()
+    text_length = 0
+
+    def pieces():
+        nonlocal text_length
+        for piece in DocumentParser().iter_text(file_path):
+            digest.update(piece.encode())
+            text_length += len(piece.strip())
+            yield piece
+
+    skills = skill_extractor.extract_skills_stream(pieces())
+    return digest.hexdigest(), text_length, skills
+
+
+def is_pdf(file_path):
+    return os.path.splitext(file_path)[1].lower() == '.pdf'
+
+
+class StageTimeoutError(Exception):
+    """A document did not finish a pipeline stage within its time limit"""
+    def __init__(self, label, stage, timeout):
+        super().__init__(f"{label} {stage} timed out after {timeout} seconds")
+        self.label = label
+        self.stage = stage
+        self.timeout = timeout
+
+
+class ParserCrashedError(Exception):
+    """The worker process parsing a document died (e.g. killed for running out of memory)"""
+    def __init__(self, label):
+        super().__init__(f"{label} could not be processed: the parser process stopped unexpectedly")
+        self.label = label
+
+
+class DocumentPipeline:
+    """Runs the parse and extract stages of several documents concurrently"""
+
+    def __init__(self, skill_extractor, max_threads=4, max_processes=2, parse_timeout=60, extract_timeout=60):
+        self.skill_extractor = skill_extractor
+        self.parse_timeout = parse_timeout
+        self.extract_timeout = extract_timeout
+        self.max_processes = max_processes
+        # DOCX/TXT parsing and spaCy extraction release the GIL often enough for threads;
+        # PDF layout analysis is pure-Python CPU work and goes to worker processes
+        self.thread_pool = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='document')
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
+
+    def _get_process_pool(self):
+        """Create the PDF worker processes on first use, and again after they were discarded"""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # Forking the threaded server could copy a lock held by another thread (e.g.
+                # stdout's) into the child, so workers come from a forkserver, or spawn where
+                # there is none, and load their own extractor
+                if 'forkserver' in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context('forkserver')
+                    context.set_forkserver_preload(WORKER_PRELOAD)
+                else:
+                    context = multiprocessing.get_context('spawn')
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_processes, mp_context=context, initializer=_init_worker
+                )
+            return self._process_pool
+
+    def _discard_process_pool(self, pool, terminate=False):
+        """Stop using a broken or stuck pool; the next PDF starts a fresh one"""
+        with self._process_pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+
+        if terminate:
+            # A worker stuck on a pathological PDF never returns on its own. This also fails
+            # other requests' PDFs running in the same pool, which then retry in the new one.
+            for process in list((pool._processes or {}).values()):
+                process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_to_workers(self, function, file_path):
+        """Submit PDF work to the process pool, replacing the pool if a worker died earlier"""
+        pool = self._get_process_pool()
+        try:
+            return pool.submit(function, file_path), pool
+        except BrokenProcessPool:
+            self._discard_process_pool(pool)
+            pool = self._get_process_pool()
+            return pool.submit(function, file_path), pool
+
+    def _submit(self, document):
+        """Start a document's first stage in the pool suited to its format and size
+
+        Returns (future, stage, timeout, process pool or None). PDFs, streamed or not, go to
+        worker processes, since their layout analysis is where the CPU time goes.
+        """
+        file_path = document['path']
+        streaming = document.get('streaming')
+        if streaming:
+            stage, timeout = 'streaming extraction', self.parse_timeout + self.extract_timeout
+        else:
+            stage, timeout = 'parsing', self.parse_timeout
+
+        if is_pdf(file_path):
+            future, pool = self._submit_to_workers(stream_document if streaming else parse_document, file_path)
+            return future, stage, timeout, pool
+        if streaming:
+            return self.thread_pool.submit(stream_document, file_path, self.skill_extractor), stage, timeout, None
+        return self.thread_pool.submit(parse_document, file_path), stage, timeout, None
+
+    def run(self, documents, lookup=None):
+        """Parse and extract documents ({'key', 'label', 'path', 'streaming'}) concurrently"""
+        # Results map each key to {'document_id', 'text', 'skills'}: 'text' is None for streamed
+        # documents, 'skills' is None for documents without text, and lookup(document, document_id) may
+        # return previously extracted skills so the extraction stage is skipped
+        results = {}
+        pending = {}  # future -> (document, stage, deadline, timeout, process pool or None)
+        retried = set()  # keys of documents resubmitted after their worker process died
+
+        def submit(document, stage, future, timeout, pool=None):
+            pending[future] = (document, stage, time.monotonic() + timeout, timeout, pool)
+
+        def start(document):
+            future, stage, timeout, pool = self._submit(document)
+            submit(document, stage, future, timeout, pool)
+
+        for document in documents:
+            start(document)
+
+        try:
+            while pending:
+                next_deadline = min(deadline for _, _, deadline, _, _ in pending.values())
+                done, _ = wait(
+                    list(pending),
+                    timeout=max(0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    document, stage, _, _, pool = pending.pop(future)
+                    key = document['key']
+
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        # The worker died (or was terminated for another request's stuck PDF);
+                        # replace the pool and give the document one more try
+                        self._discard_process_pool(pool)
+                        if key in retried:
+                            raise ParserCrashedError(document['label'])
+                        retried.add(key)
+                        start(document)
+                        continue
+
+                    if stage == 'parsing':
+                        text = result
+                        document_id = hashlib.md5(text.encode()).hexdigest()
+                        results[key] = {'document_id': document_id, 'text': text, 'skills': None}
+
+                        skills = lookup(document, document_id) if lookup and text.strip() else None
+                        if skills is not None:
+                            results[key]['skills'] = skills
+                        elif text.strip():
+                            future = self.thread_pool.submit(self.skill_extractor.extract_skills, text)
+                            submit(document, 'extraction', future, self.extract_timeout)
+                    elif stage == 'extraction':
+                        results[key]['skills'] = result
+                    else:
+                        document_id, text_length, skills = result
+                        results[key] = {
+                            'document_id': document_id,
+                            'text': None,
+                            'skills': skills if text_length else None
+                        }
+
+                now = time.monotonic()
+                for document, stage, deadline, timeout, pool in pending.values():
+                    if deadline <= now:
+                        if pool is not None:
+                            # Cancelling cannot stop a running worker, so its pool is torn down
+                            self._discard_process_pool(pool, terminate=True)
+                        raise StageTimeoutError(document['label'], stage, timeout)
+        finally:
+            # On a timeout or failure, drop the other document's queued work. Running thread
+            # stages cannot be interrupted; they finish in the background and are discarded.
+            for future in pending:
+                future.cancel()
+
+        return results
@@ -0,0 +1,113 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+
+class DocxReader:
+    """Streams the text of a DOCX straight from its XML parts, without building a document model"""
+
+    def iter_lines(self, file_path):
+        """Yield one line per paragraph or table row: headers first, then the body, then footers"""
+        with zipfile.ZipFile(file_path) as docx:
+            names = set(docx.namelist())
+            if 'word/document.xml' not in names:
+                raise ValueError("Not a Word document: word/document.xml is missing")
+
+            headers = sorted(
+                (name for name in names if re.fullmatch(r'word/header\d*\.xml', name)),
+                key=self._part_number
+            )
+            footers = sorted(
+                (name for name in names if re.fullmatch(r'word/footer\d*\.xml', name)),
+                key=self._part_number
+            )
+
+            for part in headers + ['word/document.xml'] + footers:
+                with docx.open(part) as xml_file:
+                    yield from self._iter_part(xml_file)
+
+    @staticmethod
+    def _part_number(name):
+        """Sort key placing header2.xml before header10.xml"""
+        digits = re.sub(r'\D', '', name)
+        return int(digits) if digits else 0
+
+    def _iter_part(self, xml_file):
+        """Yield the lines of one XML part in document order"""
+        paragraphs = []  # text buffers of the open (possibly nested) paragraphs
+        containers = []  # open table rows/cells and text boxes, innermost last
+        run_depth = 0
+        fallback_depth = 0  # > 0 inside mc:Fallback, which repeats its mc:Choice sibling
+        root = None  # body (or header/footer) element, cleared as lines are emitted
+
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = elem.tag
+
+            if tag == MC + 'Fallback':
+                fallback_depth += 1 if event == 'start' else -1
+                continue
+            if fallback_depth:
+                continue
+
+            if event == 'start':
+                if tag == W + 'p':
+                    paragraphs.append([])
+                elif tag == W + 'r':
+                    run_depth += 1
+                elif tag == W + 'tr':
+                    containers.append(('row', []))
+                elif tag == W + 'tc':
+                    containers.append(('cell', []))
+                elif tag == W + 'txbxContent':
+                    containers.append(('textbox', None))
+                elif tag in (W + 'body', W + 'hdr', W + 'ftr'):
+                    root = elem
+                continue
+
+            if tag == W + 't':
+                if run_depth and paragraphs and elem.text:
+                    paragraphs[-1].append(elem.text)
+            elif tag == W + 'tab':
+                # w:tab also defines tab stops in paragraph properties; only runs hold text
+                if run_depth and paragraphs:
+                    paragraphs[-1].append('\t')
+            elif tag in (W + 'br', W + 'cr'):
+                if run_depth and paragraphs:
+                    paragraphs[-1].append('\n')
+            elif tag == W + 'noBreakHyphen':
+                if run_depth and paragraphs:
+                    paragraphs[-1].append('-')
+            elif tag == W + 'r':
+                run_depth -= 1
+            elif tag == W + 'p':
+                line = ''.join(paragraphs.pop())
+                if containers and containers[-1][0] == 'cell':
+                    containers[-1][1].append(line)
+                else:
+                    yield line
+            elif tag == W + 'tc':
+                _, cell_lines = containers.pop()
+                cell_text = ' '.join(line for line in cell_lines if line)
+                if containers and containers[-1][0] == 'row':
+                    containers[-1][1].append(cell_text)
+            elif tag == W + 'tr':
+                _, cells = containers.pop()
+                line = '\t'.join(cells)
+                # A row of a nested table belongs to the enclosing cell
+                if containers and containers[-1][0] == 'cell':
+                    containers[-1][1].append(line)
+                else:
+                    yield line
+            elif tag == W + 'txbxContent':
+                containers.pop()
+
+            # Once a top-level paragraph or table is done, drop its parsed elements
+            if root is not None and not paragraphs and not containers and tag in (W + 'p', W + 'tbl'):
+                root.clear()
+
+    def read(self, file_path):
+        """Return the text of a DOCX as one string"""
+        return '\n'.join(self.iter_lines(file_path))
@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+from scipy import sparse
+
+from skill_vocabulary import SkillVocabulary
+
+
+class JobCatalog:
+    """Persistent catalog of job descriptions with pre-extracted skills for reverse matching"""
+
+    def __init__(self, catalog_path=os.path.join('data', 'job_catalog.jsonl')):
+        self.catalog_path = catalog_path
+        self.jobs = []  # job id -> stored record
+        self.vocabulary = SkillVocabulary()  # skill id = column in the skill matrix
+        self._job_terms = []  # job id -> skill ids
+        self._fingerprints = {}  # job description text hash -> job id
+        self._matrix = None  # jobs x skills CSR matrix, rebuilt lazily after additions
+        self._job_sizes = None
+        self._lock = threading.Lock()
+
+        catalog_dir = os.path.dirname(self.catalog_path)
+        if catalog_dir:
+            os.makedirs(catalog_dir, exist_ok=True)
+        self._load()
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _load(self):
+        """Rebuild the catalog from the append-only job log"""
+        if not os.path.exists(self.catalog_path):
+            return
+
+        with open(self.catalog_path, 'r', encoding='utf-8') as catalog_file:
+            for line in catalog_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line (e.g. after a crash) is skipped
+                    continue
+                self._index_record(record)
+
+        print(f"Job catalog loaded: {len(self.jobs)} jobs, {len(self.vocabulary)} skills")
+
+    @staticmethod
+    def _skill_terms(skills):
+        """Normalize a {'technical': [...], 'soft': [...]} dict into lowercase terms"""
+        terms = list(skills.get('technical', [])) + list(skills.get('soft', []))
+        return sorted(set(skill.lower().strip() for skill in terms if skill and skill.strip()))
+
+    def _index_record(self, record):
+        """Assign the next job id to a record and precompute its skill columns"""
+        job_id = len(self.jobs)
+        record['id'] = job_id
+        self.jobs.append(record)
+
+        if record.get('fingerprint'):
+            self._fingerprints[record['fingerprint']] = job_id
+
+        self._job_terms.append(self.vocabulary.intern_all(self._skill_terms(record['skills'])))
+        self._matrix = None
+
+        return job_id
+
+    def _skill_matrix(self):
+        """Return the binary jobs x skills matrix and per-job skill counts, building them if stale"""
+        if self._matrix is None:
+            indptr = np.zeros(len(self._job_terms) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(skill_ids) for skill_ids in self._job_terms])
+            indices = np.concatenate(self._job_terms) if self._job_terms else np.zeros(0, dtype=np.int32)
+            data = np.ones(indices.size, dtype=np.float32)
+            self._matrix = sparse.csr_matrix(
+                (data, indices, indptr),
+                shape=(len(self._job_terms), len(self.vocabulary))
+            )
+            self._job_sizes = np.diff(indptr).astype(np.float32)
+        return self._matrix, self._job_sizes
+
+    def add(self, title, skills, fingerprint=None):
+        """Add a job description to the catalog and return its job id"""
+        with self._lock:
+            if fingerprint and fingerprint in self._fingerprints:
+                return self._fingerprints[fingerprint]
+
+            record = {
+                'title': title,
+                'fingerprint': fingerprint,
+                'skills': {
+                    'technical': list(skills.get('technical', [])),
+                    'soft': list(skills.get('soft', []))
+                },
+                'added': datetime.now().isoformat(timespec='seconds')
+            }
+            job_id = self._index_record(record)
+
+            with open(self.catalog_path, 'a', encoding='utf-8') as catalog_file:
+                stored = {key: value for key, value in record.items() if key != 'id'}
+                catalog_file.write(json.dumps(stored) + '\n')
+
+            return job_id
+
+    def get(self, job_id):
+        """Return the stored record of a job"""
+        return self.jobs[job_id]
+
+    def rank(self, resume_skills, top_k=10):
+        """Score one resume against every job and return (job id, match percentage) pairs, best first"""
+        with self._lock:
+            if not self.jobs:
+                return []
+
+            matrix, job_sizes = self._skill_matrix()
+            resume_vector = np.zeros(matrix.shape[1], dtype=np.float32)
+            for term in self._skill_terms(resume_skills):
+                # Skills no job asks for have no column and cannot raise any score
+                skill_id = self.vocabulary.get_id(term)
+                if skill_id is not None:
+                    resume_vector[skill_id] = 1.0
+
+        # One sparse matrix-vector product gives the matched skill count of every job
+        matched_counts = matrix @ resume_vector
+        percentages = np.divide(
+            matched_counts * 100.0,
+            job_sizes,
+            out=np.zeros_like(matched_counts),
+            where=job_sizes > 0
+        )
+
+        # Jobs sharing no skill with the resume are not worth a full analysis
+        eligible = np.flatnonzero(percentages)
+        top_k = min(top_k, eligible.size)
+        if top_k <= 0:
+            return []
+        scores = percentages[eligible]
+        if top_k < eligible.size:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            best = np.arange(eligible.size)
+        best = best[np.argsort(-scores[best], kind='stable')]
+
+        return [(int(eligible[position]), round(float(scores[position]), 2)) for position in best]
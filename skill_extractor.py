@@ -42,46 +42,117 @@ class SkillExtractor:
             'creativity', 'analytical thinking', 'attention to detail', 'multitasking',
             'negotiation', 'presentation', 'public speaking', 'mentoring', 'coaching'
         }
+
+        # Chunked extraction: characters handed to regex/spaCy at once (well under spaCy's
+        # max_length), and characters rescanned across chunk boundaries (longer than any skill)
+        self.chunk_size = 100000
+        self.chunk_overlap = 200
     
     def extract_skills(self, text):
         """Extract technical and soft skills from text"""
         if not text:
             return {'technical': [], 'soft': []}
 
+        # Very large texts go through the chunked path so no step sees more than chunk_size characters
+        if len(text) > self.chunk_size:
+            return self.extract_skills_stream(
+                text[start:start + self.chunk_size] for start in range(0, len(text), self.chunk_size)
+            )
+
         # Normalize text
         text_lower = text.lower()
         text_hash = hash(text_lower) % 10000  # Simple hash for debugging
 
         print(f"Extracting skills from text (hash: {text_hash}), length: {len(text)}")
 
-        # Extract technical skills
         technical_found = set()
+        soft_found = set()
+        self._extract_chunk(text, technical_found, soft_found)
+
+        return {
+            'technical': sorted(list(technical_found)),
+            'soft': sorted(list(soft_found))
+        }
+
+    def extract_skills_stream(self, pieces):
+        """Extract skills from an iterable of text pieces, holding at most one chunk in memory"""
+        technical_found = set()
+        soft_found = set()
+        carry = ''  # tail of the previous chunk, rescanned so skills spanning the boundary are found
+        buffer = []
+        buffered = 0
+        total_length = 0
+        chunk_count = 0
+        pending = ''  # part of carry that has not been scanned yet
+
+        for piece in pieces:
+            if not piece:
+                continue
+            buffer.append(piece)
+            buffered += len(piece)
+            total_length += len(piece)
+            if buffered < self.chunk_size:
+                continue
+
+            text = carry + ''.join(buffer)
+            buffer = []
+            buffered = 0
+
+            # Stop at the last whitespace so a word cut in half (e.g. "Java|Script") is never scanned
+            cut = max(text.rfind(' '), text.rfind('\n'), text.rfind('\t')) + 1
+            if cut <= len(carry):
+                cut = len(text)
+            chunk, remainder = text[:cut], text[cut:]
+
+            self._extract_chunk(chunk, technical_found, soft_found)
+            chunk_count += 1
+
+            overlap = chunk[-self.chunk_overlap:]
+            if len(chunk) > self.chunk_overlap:
+                # Drop the leading partial word so its suffix cannot match a short skill like "Go"
+                overlap = re.sub(r'^\S+', '', overlap)
+            carry = overlap + remainder
+            pending = remainder
+
+        # Scan whatever arrived after the last full chunk
+        if buffer or pending.strip() or chunk_count == 0:
+            self._extract_chunk(carry + ''.join(buffer), technical_found, soft_found)
+            chunk_count += 1
+
+        print(f"Extracted skills from {total_length} characters in {chunk_count} chunks: "
+              f"{len(technical_found)} technical, {len(soft_found)} soft")
+
+        return {
+            'technical': sorted(list(technical_found)),
+            'soft': sorted(list(soft_found))
+        }
+
+    def _extract_chunk(self, text, technical_found, soft_found):
+        """Add the skills found in one piece of text to the given sets"""
+        text_lower = text.lower()
+
+        # Extract technical skills
         for skill in self.technical_skills:
             # Use word boundaries for better matching
             pattern = r'\b' + re.escape(skill.lower()) + r'\b'
             if re.search(pattern, text_lower):
                 technical_found.add(skill.title())
 
-        # Extract programming languages
-        programming_languages_found = set()
+        # Extract programming languages (reported together with technical skills)
         for skill in self.programming_languages:
             pattern = r'\b' + re.escape(skill.lower()) + r'\b'
             if re.search(pattern, text_lower):
-                programming_languages_found.add(skill.title())
-
-        # Combine programming languages with technical skills for the final output
-        all_technical_found = technical_found.union(programming_languages_found)
+                technical_found.add(skill.title())
 
         # Extract soft skills
-        soft_found = set()
         for skill in self.soft_skills:
             pattern = r'\b' + re.escape(skill.lower()) + r'\b'
             if re.search(pattern, text_lower):
                 soft_found.add(skill.title())
 
-        print(f"Found {len(all_technical_found)} technical skills: {list(all_technical_found)[:5]}...")
+        print(f"Found {len(technical_found)} technical skills: {list(technical_found)[:5]}...")
         print(f"Found {len(soft_found)} soft skills: {list(soft_found)[:5]}...")
-        
+
         # Use NLP for additional skill extraction if available
         if self.nlp:
             doc = self.nlp(text)
@@ -90,12 +161,7 @@ class SkillExtractor:
                 chunk_text = chunk.text.lower().strip()
                 if len(chunk_text.split()) <= 3:  # Skills are usually short phrases
                     # Check if it looks like a skill (contains tech keywords)
-                    tech_keywords = ['development', 'programming', 'framework', 'database', 
+                    tech_keywords = ['development', 'programming', 'framework', 'database',
                                    'tool', 'platform', 'system', 'software', 'language']
                     if any(keyword in chunk_text for keyword in tech_keywords):
-                        all_technical_found.add(chunk.text.strip().title())
-        
-        return {
-            'technical': sorted(list(all_technical_found)),
-            'soft': sorted(list(soft_found))
-        }
+                        technical_found.add(chunk.text.strip().title())
@@ -7,11 +7,18 @@ except ImportError:
 
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from scipy import sparse
+import threading
+from collections import OrderedDict
+from skill_vocabulary import SkillVocabulary
 
 class SkillGapAnalyzer:
     def __init__(self):
         self.model = None
         self.similarity_threshold = 0.7
+        self.embedding_cache_size = 10000
+        self._embedding_cache = OrderedDict()  # lowercase skill -> embedding
+        self._embedding_lock = threading.Lock()
         
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
@@ -25,86 +32,203 @@ class SkillGapAnalyzer:
         else:
             print("Warning: SentenceTransformer not available. Using basic matching.")
     
+    def _encode(self, skills):
+        """Encode skills, running the model only for skills not already in the embedding cache"""
+        with self._embedding_lock:
+            uncached = [skill for skill in dict.fromkeys(skills) if skill not in self._embedding_cache]
+
+        if uncached:
+            embeddings = self.model.encode(uncached)
+            with self._embedding_lock:
+                for skill, embedding in zip(uncached, embeddings):
+                    self._embedding_cache[skill] = embedding
+                while len(self._embedding_cache) > self.embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+
+        with self._embedding_lock:
+            vectors = []
+            for skill in skills:
+                embedding = self._embedding_cache.get(skill)
+                if embedding is None:
+                    # Evicted by a concurrent request between encoding and lookup
+                    embedding = self.model.encode([skill])[0]
+                else:
+                    self._embedding_cache.move_to_end(skill)
+                vectors.append(embedding)
+
+        return np.array(vectors)
+
+    @staticmethod
+    def skill_delta(old_skills, new_skills):
+        """Return the skills added and removed between two extractions of a document"""
+        delta = {'added': {}, 'removed': {}}
+        for category in ('technical', 'soft'):
+            old = set(skill.lower() for skill in old_skills.get(category, []))
+            new = set(skill.lower() for skill in new_skills.get(category, []))
+            delta['added'][category] = sorted(skill.title() for skill in new - old)
+            delta['removed'][category] = sorted(skill.title() for skill in old - new)
+        return delta
+
+    def analyze_incremental(self, previous, resume_skills, jd_skills):
+        """Update a previous analysis for the skills added or removed since; returns (result, best matches)
+
+        previous holds the earlier run's 'resume_skills', 'jd_skills', 'analysis' and
+        'best_matches'. Exact matches are plain set algebra over the new skills; only the
+        unmatched JD skills whose closest resume skill may have changed are scored again.
+        """
+        resume_delta = self.skill_delta(previous.get('resume_skills', {}), resume_skills)
+        jd_delta = self.skill_delta(previous.get('jd_skills', {}), jd_skills)
+
+        changed = any(
+            skills
+            for delta in (resume_delta, jd_delta)
+            for side in delta.values()
+            for skills in side.values()
+        )
+
+        if 'analysis' not in previous or 'best_matches' not in previous:
+            result, best_matches = self.analyze_with_matches(resume_skills, jd_skills)
+        elif changed:
+            result, best_matches = self._update_analysis(previous, resume_skills, jd_skills)
+        else:
+            result, best_matches = dict(previous['analysis']), previous['best_matches']
+
+        result['delta'] = {'resume': resume_delta, 'jd': jd_delta}
+        return result, best_matches
+
+    def _update_analysis(self, previous, resume_skills, jd_skills):
+        """Recompute a previous analysis from its best matches, re-scoring only what the delta touches"""
+        result = {key: {} for key in ('matched', 'partially_matched', 'missing', 'extra')}
+        best_matches = {}
+        total_resume = total_jd = total_matched = total_missing = 0
+
+        for category in ('technical', 'soft'):
+            resume = self._canonical_skills(resume_skills.get(category, []))
+            jd = self._canonical_skills(jd_skills.get(category, []))
+            old_resume = set(self._canonical_skills(previous['resume_skills'].get(category, [])))
+            old_jd = set(self._canonical_skills(previous['jd_skills'].get(category, [])))
+
+            resume_set, jd_set = set(resume), set(jd)
+            unmatched_jd = [skill for skill in jd if skill not in resume_set]
+            extra = [skill for skill in resume if skill not in jd_set]
+
+            best = self._update_best_matches(
+                previous['best_matches'].get(category, {}), unmatched_jd, extra, old_resume - old_jd
+            )
+            best_matches[category] = best
+
+            partially_matched = []
+            paired_jd, paired_resume = set(), set()
+            for skill in unmatched_jd:
+                match = best.get(skill)
+                if match and 0.5 <= match[1] < 0.85:  # Partial match threshold, as in analyze
+                    partially_matched.append({
+                        'jd_skill': skill.title(),
+                        'resume_skill': match[0].title(),
+                        'similarity': match[1]
+                    })
+                    paired_jd.add(skill)
+                    paired_resume.add(match[0])
+
+            missing = [skill.title() for skill in unmatched_jd if skill not in paired_jd]
+            result['matched'][category] = [skill.title() for skill in resume if skill in jd_set]
+            result['partially_matched'][category] = partially_matched
+            result['missing'][category] = missing
+            result['extra'][category] = [skill.title() for skill in extra if skill not in paired_resume]
+
+            total_resume += len(resume)
+            total_jd += len(jd)
+            total_matched += len(result['matched'][category])
+            total_missing += len(missing)
+
+        match_percentage = (total_matched / total_jd * 100) if total_jd > 0 else 0
+        result['match_percentage'] = round(match_percentage, 2)
+        result['summary'] = {
+            'total_resume_skills': total_resume,
+            'total_jd_skills': total_jd,
+            'matched_count': total_matched,
+            'missing_count': total_missing
+        }
+        return result, best_matches
+
+    def _update_best_matches(self, previous_best, unmatched_jd, extra, previous_extra):
+        """Closest extra resume skill of every unmatched JD skill, reusing the previous ones where still valid"""
+        if not (self.model and unmatched_jd and extra):
+            return {}
+
+        extra_set = set(extra)
+        added = [skill for skill in extra if skill not in previous_extra]
+
+        # A previous best match that is still an extra skill stays the best among the old
+        # extras, so only the added extras can beat it; everything else is scored in full
+        best = {}
+        rescore = []
+        for skill in unmatched_jd:
+            match = previous_best.get(skill)
+            if match is None or match[0] not in extra_set:
+                rescore.append(skill)
+            else:
+                best[skill] = [match[0], match[1]]
+
+        kept = list(best)
+        if kept and added:
+            similarity_matrix = cosine_similarity(self._encode(kept), self._encode(added))
+            for row, skill in enumerate(kept):
+                column = int(np.argmax(similarity_matrix[row]))
+                if similarity_matrix[row][column] > best[skill][1]:
+                    best[skill] = [added[column], float(similarity_matrix[row][column])]
+
+        if rescore:
+            similarity_matrix = cosine_similarity(self._encode(rescore), self._encode(extra))
+            for row, skill in enumerate(rescore):
+                column = int(np.argmax(similarity_matrix[row]))
+                best[skill] = [extra[column], float(similarity_matrix[row][column])]
+
+        return best
+
+    @staticmethod
+    def _canonical_skills(skills):
+        """Canonical skill names in first-seen order, without duplicates"""
+        return list(dict.fromkeys(
+            SkillVocabulary.canonical(skill) for skill in skills if skill and skill.strip()
+        ))
+
     def analyze(self, resume_skills, jd_skills):
         """Analyze skill gap between resume and job description"""
-        resume_tech = set(skill.lower() for skill in resume_skills.get('technical', []))
-        resume_soft = set(skill.lower() for skill in resume_skills.get('soft', []))
-        
-        jd_tech = set(skill.lower() for skill in jd_skills.get('technical', []))
-        jd_soft = set(skill.lower() for skill in jd_skills.get('soft', []))
-        
+        return self.analyze_with_matches(resume_skills, jd_skills)[0]
+
+    def analyze_with_matches(self, resume_skills, jd_skills):
+        """Analyze, also returning each unmatched JD skill's closest resume skill for analyze_incremental"""
+        # Two documents hold a few dozen skills, so plain set algebra beats interning them to ids
+        resume_tech = self._skill_set(resume_skills.get('technical', []))
+        resume_soft = self._skill_set(resume_skills.get('soft', []))
+
+        jd_tech = self._skill_set(jd_skills.get('technical', []))
+        jd_soft = self._skill_set(jd_skills.get('soft', []))
+
         # Exact matches
-        matched_tech = resume_tech.intersection(jd_tech)
-        matched_soft = resume_soft.intersection(jd_soft)
-        
+        matched_tech = resume_tech & jd_tech
+        matched_soft = resume_soft & jd_soft
+
         # Missing skills
         missing_tech = jd_tech - resume_tech
         missing_soft = jd_soft - resume_soft
-        
+
         # Skills in resume but not in JD
         extra_tech = resume_tech - jd_tech
         extra_soft = resume_soft - jd_soft
-        
+
         # Semantic matching for partial matches
-        partially_matched_tech = []
-        partially_matched_soft = []
-        
-        if self.model:
-            # Technical skills semantic matching
-            unmatched_jd_tech = list(missing_tech)
-            unmatched_resume_tech = list(extra_tech)
-            
-            if unmatched_jd_tech and unmatched_resume_tech:
-                jd_embeddings = self.model.encode(unmatched_jd_tech)
-                resume_embeddings = self.model.encode(unmatched_resume_tech)
-                
-                similarity_matrix = cosine_similarity(jd_embeddings, resume_embeddings)
-                
-                for i, jd_skill in enumerate(unmatched_jd_tech):
-                    max_sim_idx = np.argmax(similarity_matrix[i])
-                    max_similarity = similarity_matrix[i][max_sim_idx]
-                    
-                    if 0.5 <= max_similarity < 0.85:  # Partial match threshold
-                        resume_skill = unmatched_resume_tech[max_sim_idx]
-                        partially_matched_tech.append({
-                            'jd_skill': jd_skill.title(),
-                            'resume_skill': resume_skill.title(),
-                            'similarity': float(max_similarity)
-                        })
-                        # Remove from missing/extra lists
-                        missing_tech.discard(jd_skill)
-                        extra_tech.discard(resume_skill)
-            
-            # Soft skills semantic matching
-            unmatched_jd_soft = list(missing_soft)
-            unmatched_resume_soft = list(extra_soft)
-            
-            if unmatched_jd_soft and unmatched_resume_soft:
-                jd_embeddings = self.model.encode(unmatched_jd_soft)
-                resume_embeddings = self.model.encode(unmatched_resume_soft)
-                
-                similarity_matrix = cosine_similarity(jd_embeddings, resume_embeddings)
-                
-                for i, jd_skill in enumerate(unmatched_jd_soft):
-                    max_sim_idx = np.argmax(similarity_matrix[i])
-                    max_similarity = similarity_matrix[i][max_sim_idx]
-                    
-                    if 0.5 <= max_similarity < 0.85:
-                        resume_skill = unmatched_resume_soft[max_sim_idx]
-                        partially_matched_soft.append({
-                            'jd_skill': jd_skill.title(),
-                            'resume_skill': resume_skill.title(),
-                            'similarity': float(max_similarity)
-                        })
-                        missing_soft.discard(jd_skill)
-                        extra_soft.discard(resume_skill)
-        
+        partially_matched_tech, best_tech = self._match_partially(missing_tech, extra_tech)
+        partially_matched_soft, best_soft = self._match_partially(missing_soft, extra_soft)
+
         # Calculate match percentage
         total_jd_skills = len(jd_tech) + len(jd_soft)
         total_matched = len(matched_tech) + len(matched_soft)
-        
+
         match_percentage = (total_matched / total_jd_skills * 100) if total_jd_skills > 0 else 0
-        
+
+        best_matches = {'technical': best_tech, 'soft': best_soft}
         return {
             'match_percentage': round(match_percentage, 2),
             'matched': {
@@ -129,4 +253,107 @@ class SkillGapAnalyzer:
                 'matched_count': total_matched,
                 'missing_count': len(missing_tech) + len(missing_soft)
             }
-        }
+        }, best_matches
+
+    @staticmethod
+    def _skill_set(skills):
+        """Canonical (lowercase) names of a skill list, as a set"""
+        names = {skill.lower().strip() for skill in skills if skill}
+        names.discard('')
+        return names
+
+    def _match_partially(self, missing, extra):
+        """Pair missing JD skills with semantically similar extra resume skills, removing both from their sets
+
+        Also returns the closest extra skill and its similarity for every missing JD skill.
+        """
+        if not (self.model and missing and extra):
+            return [], {}
+
+        unmatched_jd = list(missing)
+        unmatched_resume = list(extra)
+
+        jd_embeddings = self._encode(unmatched_jd)
+        resume_embeddings = self._encode(unmatched_resume)
+
+        similarity_matrix = cosine_similarity(jd_embeddings, resume_embeddings)
+        best_matches = np.argmax(similarity_matrix, axis=1)
+
+        partially_matched = []
+        closest = {}
+        for row, jd_skill in enumerate(unmatched_jd):
+            max_sim_idx = best_matches[row]
+            max_similarity = similarity_matrix[row][max_sim_idx]
+            resume_skill = unmatched_resume[max_sim_idx]
+            closest[jd_skill] = [resume_skill, float(max_similarity)]
+
+            if 0.5 <= max_similarity < 0.85:  # Partial match threshold
+                partially_matched.append({
+                    'jd_skill': jd_skill.title(),
+                    'resume_skill': resume_skill.title(),
+                    'similarity': float(max_similarity)
+                })
+                # Remove from missing/extra lists
+                missing.discard(jd_skill)
+                extra.discard(resume_skill)
+
+        return partially_matched, closest
+
+    @staticmethod
+    def match_matrix(resume_skill_sets, jd_skill_sets, jd_block_size=1024):
+        """Return the match percentage of every resume (rows) against every job description (columns)"""
+        # Only JD skills get columns: a resume skill no JD asks for cannot raise any score, so
+        # the matrices stay as wide as the JDs' skills however many resumes are scored
+        vocabulary = SkillVocabulary()
+        jd_columns = SkillGapAnalyzer._skill_columns(vocabulary, jd_skill_sets, vocabulary.intern)
+        resume_columns = SkillGapAnalyzer._skill_columns(vocabulary, resume_skill_sets, vocabulary.get_id)
+
+        width = 2 * len(vocabulary)
+        resumes = SkillGapAnalyzer._skill_matrix(resume_columns, width)
+        jds = SkillGapAnalyzer._skill_matrix(jd_columns, width)
+        jd_totals = np.diff(jds.indptr).astype(np.float32)
+
+        # Exact matches only, like analyze's match_percentage: matched JD skills / JD skills.
+        # The sparse product is densified one block of JDs at a time.
+        percentages = np.zeros((resumes.shape[0], jds.shape[0]), dtype=np.float32)
+        for start in range(0, jds.shape[0], jd_block_size):
+            end = min(start + jd_block_size, jds.shape[0])
+            matched_counts = (resumes @ jds[start:end].T).toarray()
+            totals = jd_totals[start:end]
+            np.divide(
+                matched_counts * 100,
+                totals,
+                out=percentages[:, start:end],
+                where=totals > 0
+            )
+        return np.round(percentages, 2)
+
+    @staticmethod
+    def _skill_columns(vocabulary, skill_sets, skill_id):
+        """Map {'technical', 'soft'} skill dicts to CSR (indices, indptr): column 2*id is technical, 2*id + 1 soft
+
+        skill_id(skill) returns a skill's id, or None for a skill that gets no column.
+        """
+        indices = []
+        indptr = [0]
+        for skills in skill_sets:
+            columns = set()
+            for offset, category in enumerate(('technical', 'soft')):
+                for skill in skills.get(category, []):
+                    if skill and skill.strip():
+                        column = skill_id(skill)
+                        if column is not None:
+                            columns.add(2 * column + offset)
+            indices.extend(sorted(columns))
+            indptr.append(len(indices))
+        return indices, indptr
+
+    @staticmethod
+    def _skill_matrix(skill_columns, width):
+        """Build the binary CSR matrix of a _skill_columns result"""
+        indices, indptr = skill_columns
+        data = np.ones(len(indices), dtype=np.float32)
+        return sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, width)
+        )
@@ -0,0 +1,45 @@
+import threading
+
+import numpy as np
+
+
+class SkillVocabulary:
+    """Interns canonical (lowercase) skill names to compact integer ids"""
+
+    def __init__(self):
+        self._ids = {}  # canonical name -> id
+        self._names = []  # id -> canonical name
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._names)
+
+    @staticmethod
+    def canonical(skill):
+        """Return the canonical form of a skill name"""
+        return skill.lower().strip()
+
+    def intern(self, skill):
+        """Return the id of a skill, assigning the next free id the first time it is seen"""
+        name = self.canonical(skill)
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = skill_id
+        return skill_id
+
+    def intern_all(self, skills):
+        """Return the ids of several skills as an int array"""
+        return np.fromiter((self.intern(skill) for skill in skills if skill and skill.strip()), dtype=np.int32)
+
+    def get_id(self, skill):
+        """Return the id of a known skill, or None without adding it"""
+        return self._ids.get(self.canonical(skill))
+
+    def name(self, skill_id):
+        """Return the canonical name of a skill id"""
+        return self._names[skill_id]
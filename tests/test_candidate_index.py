@@ -0,0 +1,67 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from candidate_index import CandidateIndex  # noqa: E402
+
+RESUME = "Jane Doe\nSkills: Python, SQL, Docker, communication and teamwork.\n"
+EDITED_RESUME = RESUME + "Recently added Kubernetes and AWS.\n"
+JOB_DESCRIPTION = "We need Python, SQL, Kubernetes and AWS with strong communication.\n"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # app creates uploads/ and reports/ relative to the working directory on import
+    monkeypatch.chdir(tmp_path)
+    import app
+
+    monkeypatch.setattr(app, 'candidate_index', CandidateIndex(str(tmp_path / 'candidates.jsonl')))
+    monkeypatch.setitem(app.app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    return app.app.test_client()
+
+
+def upload(client, resume_text, filename='resume.txt'):
+    response = client.post('/upload', data={
+        'resume': (io.BytesIO(resume_text.encode()), filename),
+        'job_description': (io.BytesIO(JOB_DESCRIPTION.encode()), 'jd.txt')
+    }, content_type='multipart/form-data')
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_reuploading_an_edited_resume_replaces_its_candidate(client):
+    import app
+
+    first = upload(client, RESUME)
+    second = upload(client, EDITED_RESUME)
+
+    assert len(app.candidate_index) == 1
+    assert second['candidate_id'] == first['candidate_id']
+    assert app.candidate_index.find(['kubernetes']) == [first['candidate_id']]
+
+
+def test_a_different_resume_is_a_new_candidate(client):
+    import app
+
+    upload(client, RESUME)
+    upload(client, EDITED_RESUME, filename='other_resume.txt')
+
+    assert len(app.candidate_index) == 2
+
+
+def test_replacement_survives_a_reload(tmp_path):
+    index_path = str(tmp_path / 'candidates.jsonl')
+    index = CandidateIndex(index_path)
+    candidate_id = index.add('resume.txt', {'technical': ['Python', 'SQL']}, fingerprint='a')
+    index.add('other.txt', {'technical': ['Python']}, fingerprint='b')
+    index.add('resume.txt', {'technical': ['Python', 'Docker']}, fingerprint='c', candidate_id=candidate_id)
+
+    reloaded = CandidateIndex(index_path)
+    assert len(reloaded) == 2
+    assert reloaded.find(['sql']) == []
+    assert reloaded.find(['python']) == [0, 1]
+    assert reloaded.find(['docker']) == [candidate_id]